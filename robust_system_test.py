@@ -14,10 +14,14 @@ This script provides comprehensive testing for:
 """
 
 import os
+import re
 import sys
 import django
+import functools
+import importlib
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 import json
@@ -38,6 +42,7 @@ from django.core.management import execute_from_command_line
 from django.template.loader import get_template
 from django.db import connection
 from django.apps import apps
+from django.conf import settings
 import logging
 
 # Import all models to check for import errors
@@ -56,39 +61,117 @@ from ricd.models import (
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# NameError markers in rendered output; bytes form scans response.content undecoded
+_NAMEERR_RE = re.compile(rb"NameError|name '[^']+' is not defined")
+_NAMEERR_RE_STR = re.compile(r"NameError|name '[^']+' is not defined")
+
+
+# Imports that are commonly problematic: (module, names it must expose)
+IMPORT_CHECKS = [
+    ('django.contrib.auth.models', ['User', 'Group']),
+    ('ricd.models', ['Council', 'Program', 'Project']),
+    ('portal.views', ['RICDDashboardView', 'CouncilDashboardView']),
+    ('portal.forms', ['CouncilForm', 'ProgramForm']),
+]
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_reverse(name, kwargs_items):
+    """reverse() memoised on (name, sorted kwargs items); URLconf is fixed for the run"""
+    return reverse(name, kwargs=dict(kwargs_items))
+
 
 class PreDeploymentValidator:
     """Handles pre-deployment setup and validation"""
 
+    @staticmethod
+    def _run_command(argv):
+        """Run one command without a shell and log the outcome"""
+        cmd = ' '.join(argv)
+        try:
+            logger.info(f"Executing: {cmd}")
+            # stdout is never logged for these, so don't buffer it
+            result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    text=True, timeout=30)
+
+            if result.returncode == 0:
+                logger.info(f"✅ Command successful: {cmd}")
+            else:
+                logger.warning(f"⚠️ Command failed: {cmd}")
+                logger.warning(f"Error: {result.stderr}")
+
+        except subprocess.TimeoutExpired:
+            logger.error(f"⏰ Command timed out: {cmd}")
+        except Exception as e:
+            logger.error(f"❌ Command error: {cmd} - {e}")
+
+    @staticmethod
+    def _show_status(argv):
+        """Run a status command to completion and log the head of its output.
+
+        Callers bound the output at the source (e.g. systemctl --lines), so
+        capturing all of it stays small while the exit code stays meaningful.
+        """
+        cmd = ' '.join(argv)
+        logger.info(f"Executing: {cmd}")
+        try:
+            result = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    text=True, timeout=30)
+        except subprocess.TimeoutExpired:
+            logger.error(f"⏰ Command timed out: {cmd}")
+            return
+        except Exception as e:
+            logger.error(f"❌ Command error: {cmd} - {e}")
+            return
+
+        if result.returncode == 0:
+            logger.info(f"✅ Command successful: {cmd}")
+        else:
+            logger.warning(f"⚠️ Command failed: {cmd}")
+        if result.stdout:
+            logger.info(f"Output: {result.stdout[:200]}...")
+
     @staticmethod
     def run_pre_commands():
         """Execute the required pre-test commands"""
         logger.info("🚀 Running pre-deployment commands...")
 
-        commands = [
-            "cd /opt/ricd/testproj && bash -c 'source venv/bin/activate && python manage.py shell -c \"from django.urls import clear_url_caches; clear_url_caches()\"'",
-            "sudo systemctl restart ricd",
-            "sudo systemctl status ricd",
-            "sudo systemctl restart nginx"
-        ]
+        # Same process, same URLconf: no need to boot a manage.py shell for this
+        from django.urls import clear_url_caches
+        clear_url_caches()
+        logger.info("✅ URL caches cleared")
 
-        for cmd in commands:
-            try:
-                logger.info(f"Executing: {cmd}")
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
+        # The two services are independent, so restart them together
+        restarts = [
+            ["sudo", "systemctl", "restart", "ricd"],
+            ["sudo", "systemctl", "restart", "nginx"],
+        ]
+        with ThreadPoolExecutor(max_workers=len(restarts)) as executor:
+            list(executor.map(PreDeploymentValidator._run_command, restarts))
 
-                if result.returncode == 0:
-                    logger.info(f"✅ Command successful: {cmd}")
-                    if result.stdout:
-                        logger.info(f"Output: {result.stdout[:200]}...")
-                else:
-                    logger.warning(f"⚠️ Command failed: {cmd}")
-                    logger.warning(f"Error: {result.stderr}")
+        PreDeploymentValidator._show_status(
+            ["sudo", "systemctl", "status", "--no-pager", "--lines=5", "ricd"])
 
-            except subprocess.TimeoutExpired:
-                logger.error(f"⏰ Command timed out: {cmd}")
-            except Exception as e:
-                logger.error(f"❌ Command error: {cmd} - {e}")
+    @staticmethod
+    def _missing_tables(required_tables):
+        """Probe only the required names instead of listing the whole catalog"""
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(
+                    "SELECT t FROM unnest(%s::text[]) AS t WHERE to_regclass(t) IS NULL",
+                    [required_tables],
+                )
+                return [row[0] for row in cursor.fetchall()]
+            if connection.vendor == 'sqlite':
+                placeholders = ', '.join(['%s'] * len(required_tables))
+                cursor.execute(
+                    f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+                    required_tables,
+                )
+                existing = {row[0] for row in cursor.fetchall()}
+                return [table for table in required_tables if table not in existing]
+        existing = set(connection.introspection.table_names())
+        return [table for table in required_tables if table not in existing]
 
     @staticmethod
     def validate_environment():
@@ -111,10 +194,7 @@ class PreDeploymentValidator:
             'ricd_work', 'ricd_worktype', 'ricd_outputtype', 'auth_user'
         ]
 
-        with connection.cursor() as cursor:
-            existing_tables = connection.introspection.table_names()
-
-        missing_tables = [table for table in required_tables if table not in existing_tables]
+        missing_tables = PreDeploymentValidator._missing_tables(required_tables)
         if missing_tables:
             issues.append(f"Missing required tables: {missing_tables}")
 
@@ -139,95 +219,185 @@ class PreDeploymentValidator:
 class ComprehensiveURLTester(TestCase):
     """Comprehensive URL and functionality tester"""
 
-    def setUp(self):
-        """Set up test fixtures and data"""
-        self.client = Client()
-        self.errors = []
-        self.warnings = []
-
+    # URL patterns that need no fixture pks; built once with the class
+    STATIC_URL_PATTERNS = [
+        # Dashboard URLs
+        {'name': 'portal:ricd_dashboard', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:council_dashboard', 'method': 'GET', 'requires_auth': True, 'user': 'council_user'},
+
+        # List views
+        {'name': 'portal:council_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:program_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:project_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:work_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:user_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:officer_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:defect_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:funding_approval_list', 'method': 'GET', 'requires_auth': True},
+
+        # Create views
+        {'name': 'portal:council_create', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:program_create', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:project_create', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:user_create', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:officer_create', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:funding_approval_create', 'method': 'GET', 'requires_auth': True},
+
+        # Analytics and reports
+        {'name': 'portal:analytics_dashboard', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:monthly_report', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:quarterly_report', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:stage1_report', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:stage2_report', 'method': 'GET', 'requires_auth': True},
+
+        # Help pages
+        {'name': 'portal:help_ricd', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:help_council', 'method': 'GET', 'requires_auth': True},
+
+        # Work Type and Output Type management
+        {'name': 'portal:work_type_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:work_type_create', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:output_type_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:output_type_create', 'method': 'GET', 'requires_auth': True},
+
+        # Construction Method management
+        {'name': 'portal:construction_method_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:construction_method_create', 'method': 'GET', 'requires_auth': True},
+
+        # Agreement URLs
+        {'name': 'portal:forward_rpf_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:interim_frp_list', 'method': 'GET', 'requires_auth': True},
+        {'name': 'portal:remote_capital_program_list', 'method': 'GET', 'requires_auth': True},
+
+        # Special configuration pages
+        {'name': 'portal:work_output_type_config', 'method': 'GET', 'requires_auth': True},
+    ]
+
+    # Critical templates to test
+    CRITICAL_TEMPLATES = [
+        'portal/base.html',
+        'portal/ricd_dashboard.html',
+        'portal/council_dashboard.html',
+        'portal/project_detail.html',
+        'portal/user_list.html',
+        'portal/user_form.html',
+        'portal/council_form.html',
+        'portal/program_form.html',
+        'portal/project_form.html',
+    ]
+    _compiled_templates = {}
+
+    @classmethod
+    def _template(cls, name):
+        """get_template() once per name for the class; load errors still raise per template"""
+        if name not in cls._compiled_templates:
+            cls._compiled_templates[name] = get_template(name)
+        return cls._compiled_templates[name]
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class; TestCase rolls each test back to them"""
         # Create test users with different roles
         User = get_user_model()
 
-        # Superuser
-        self.superuser = User.objects.create_superuser(
-            username='admin',
-            email='admin@test.com',
-            password='admin123'
-        )
-
-        # Council user
-        self.council_user = User.objects.create_user(
-            username='council_test',
-            email='council@test.com',
-            password='council123'
-        )
+        # Superuser and council user in one INSERT. Clients use force_login,
+        # so neither account needs a (hashed) password.
+        cls.superuser, cls.council_user = User.objects.bulk_create([
+            User(
+                username='admin',
+                email='admin@test.com',
+                is_staff=True,
+                is_superuser=True
+            ),
+            User(
+                username='council_test',
+                email='council@test.com'
+            ),
+        ])
 
         # Create basic data for testing
-        self.council = Council.objects.create(
+        cls.council = Council.objects.create(
             name='Test Council',
             abn='12345678901',
             default_suburb='Test Suburb'
         )
 
         # Create user profile for council user
-        UserProfile.objects.create(user=self.council_user, council=self.council)
+        UserProfile.objects.create(user=cls.council_user, council=cls.council)
 
-        self.program = Program.objects.create(
+        cls.program = Program.objects.create(
             name='Test Program',
             description='Test program description'
         )
 
-        self.project = Project.objects.create(
-            council=self.council,
-            program=self.program,
+        cls.project = Project.objects.create(
+            council=cls.council,
+            program=cls.program,
             name='Test Project'
         )
 
-        self.address = Address.objects.create(
-            project=self.project,
+        cls.address = Address.objects.create(
+            project=cls.project,
             street='123 Test Street',
             suburb='Test Suburb',
             postcode='4000'
         )
 
-        self.work_type = WorkType.objects.create(
+        cls.work_type = WorkType.objects.create(
             code='test_wt',
             name='Test Work Type'
         )
 
-        self.output_type = OutputType.objects.create(
+        cls.output_type = OutputType.objects.create(
             code='test_ot',
             name='Test Output Type'
         )
 
         # Create work for testing
-        self.work = Work.objects.create(
-            address=self.address,
-            work_type_id=self.work_type,
-            output_type_id=self.output_type,
+        cls.work = Work.objects.create(
+            address=cls.address,
+            work_type_id=cls.work_type,
+            output_type_id=cls.output_type,
             estimated_cost=10000
         )
 
         # Create an officer for testing officer URLs
         try:
-            self.officer = Officer.objects.create(
-                user=self.council_user,
+            cls.officer = Officer.objects.create(
+                user=cls.council_user,
                 position='Test Officer',
                 is_principal=True
             )
         except Exception as e:
             logger.warning(f"Could not create officer: {e}")
-            self.officer = None
+            cls.officer = None
+
+    def setUp(self):
+        """Per-test client and result collectors"""
+        self.client = Client()
+        self.errors = []
+        self.warnings = []
+
+        # Log each user in once; force_login skips the password hasher
+        self.admin_client = Client()
+        self.admin_client.force_login(self.superuser)
+        self.council_client = Client()
+        self.council_client.force_login(self.council_user)
 
     def log_error(self, message, url=None, exception=None):
-        """Log an error with context"""
+        """Log an error with context; a bytes body snippet is kept undecoded"""
+        if isinstance(exception, bytes):
+            detail = exception
+        else:
+            detail = str(exception) if exception else None
         error_info = {
             'message': message,
             'url': url,
-            'exception': str(exception) if exception else None
+            'exception': detail
         }
         self.errors.append(error_info)
-        logger.error(f"❌ {message}" + (f" (URL: {url})" if url else ""))
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("❌ %s%s", message, f" (URL: {url})" if url else "")
 
     def log_warning(self, message, url=None):
         """Log a warning with context"""
@@ -243,43 +413,21 @@ class ComprehensiveURLTester(TestCase):
 
         logger.info("🔍 Testing all URL patterns...")
 
-        # Comprehensive list of URL patterns with parameters
-        url_patterns = [
-            # Dashboard URLs
-            {'name': 'portal:ricd_dashboard', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:council_dashboard', 'method': 'GET', 'requires_auth': True, 'user': 'council_user'},
-
-            # List views
-            {'name': 'portal:council_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:program_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:project_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:work_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:user_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:officer_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:defect_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:funding_approval_list', 'method': 'GET', 'requires_auth': True},
-
+        # Patterns whose kwargs depend on this run's fixture rows
+        param_patterns = [
             # Detail views with parameters
             {'name': 'portal:project_detail', 'method': 'GET', 'kwargs': {'pk': self.project.pk}, 'requires_auth': True},
             {'name': 'portal:council_detail', 'method': 'GET', 'kwargs': {'pk': self.council.pk}, 'requires_auth': True},
             {'name': 'portal:program_detail', 'method': 'GET', 'kwargs': {'pk': self.program.pk}, 'requires_auth': True},
             {'name': 'portal:user_detail', 'method': 'GET', 'kwargs': {'pk': self.council_user.pk}, 'requires_auth': True},
-            {'name': 'portal:officer_detail', 'method': 'GET', 'kwargs': {'pk': self.officer.pk if self.officer else 1}, 'requires_auth': True},  # Officer may not exist
-
-            # Create views
-            {'name': 'portal:council_create', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:program_create', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:project_create', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:user_create', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:officer_create', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:funding_approval_create', 'method': 'GET', 'requires_auth': True},
+            {'name': 'portal:officer_detail', 'method': 'GET', 'kwargs': {'pk': self.officer.pk if self.officer else None}, 'requires_auth': True, 'skip_if': lambda s: s.officer is None},  # Officer may not exist
 
             # Update views with parameters
             {'name': 'portal:council_update', 'method': 'GET', 'kwargs': {'pk': self.council.pk}, 'requires_auth': True},
             {'name': 'portal:program_update', 'method': 'GET', 'kwargs': {'pk': self.program.pk}, 'requires_auth': True},
             {'name': 'portal:project_update', 'method': 'GET', 'kwargs': {'pk': self.project.pk}, 'requires_auth': True},
             {'name': 'portal:user_update', 'method': 'GET', 'kwargs': {'pk': self.council_user.pk}, 'requires_auth': True},
-            {'name': 'portal:officer_update', 'method': 'GET', 'kwargs': {'pk': self.officer.pk if self.officer else 1}, 'requires_auth': True},  # Officer may not exist
+            {'name': 'portal:officer_update', 'method': 'GET', 'kwargs': {'pk': self.officer.pk if self.officer else None}, 'requires_auth': True, 'skip_if': lambda s: s.officer is None},  # Officer may not exist
 
             # Delete views with parameters
             {'name': 'portal:council_delete', 'method': 'GET', 'kwargs': {'pk': self.council.pk}, 'requires_auth': True},
@@ -290,132 +438,117 @@ class ComprehensiveURLTester(TestCase):
             {'name': 'portal:address_create', 'method': 'GET', 'kwargs': {'project_pk': self.project.pk}, 'requires_auth': True},
             {'name': 'portal:work_create', 'method': 'GET', 'kwargs': {'project_pk': self.project.pk}, 'requires_auth': True},
 
-            # Analytics and reports
-            {'name': 'portal:analytics_dashboard', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:monthly_report', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:quarterly_report', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:stage1_report', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:stage2_report', 'method': 'GET', 'requires_auth': True},
-
-            # Help pages
-            {'name': 'portal:help_ricd', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:help_council', 'method': 'GET', 'requires_auth': True},
-
             # Work Type and Output Type management
-            {'name': 'portal:work_type_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:work_type_create', 'method': 'GET', 'requires_auth': True},
             {'name': 'portal:work_type_update', 'method': 'GET', 'kwargs': {'pk': self.work_type.pk}, 'requires_auth': True},
             {'name': 'portal:work_type_delete', 'method': 'GET', 'kwargs': {'pk': self.work_type.pk}, 'requires_auth': True},
-
-            {'name': 'portal:output_type_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:output_type_create', 'method': 'GET', 'requires_auth': True},
             {'name': 'portal:output_type_update', 'method': 'GET', 'kwargs': {'pk': self.output_type.pk}, 'requires_auth': True},
             {'name': 'portal:output_type_delete', 'method': 'GET', 'kwargs': {'pk': self.output_type.pk}, 'requires_auth': True},
-
-            # Construction Method management
-            {'name': 'portal:construction_method_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:construction_method_create', 'method': 'GET', 'requires_auth': True},
-
-            # Agreement URLs
-            {'name': 'portal:forward_rpf_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:interim_frp_list', 'method': 'GET', 'requires_auth': True},
-            {'name': 'portal:remote_capital_program_list', 'method': 'GET', 'requires_auth': True},
-
-            # Special configuration pages
-            {'name': 'portal:work_output_type_config', 'method': 'GET', 'requires_auth': True},
         ]
+        url_patterns = self.STATIC_URL_PATTERNS + param_patterns
+
+        # Don't spend a request on rows whose fixture object couldn't be created
+        skipped = [p for p in url_patterns if p.get('skip_if') and p['skip_if'](self)]
+        for pattern in skipped:
+            self.log_warning(f"Skipped {pattern['name']}: fixture object missing")
+        url_patterns = [p for p in url_patterns if p not in skipped]
 
         tested_urls = 0
         successful_urls = 0
 
+        # One request at a time on the test thread: worker threads would have to
+        # share this thread's only connection, and with it the TestCase transaction
         for pattern in url_patterns:
             with self.subTest(url_name=pattern['name'], method=pattern['method']):
                 tested_urls += 1
-
-                # Login appropriate user if required
-                if pattern.get('requires_auth'):
-                    if pattern.get('user') == 'council_user':
-                        self.client.login(username='council_test', password='council123')
-                    else:
-                        self.client.login(username='admin', password='admin123')
-
-                # Get URL kwargs
-                kwargs = pattern.get('kwargs', {})
-                data = pattern.get('data', {})
-
-                # Try to reverse URL
-                try:
-                    url = reverse(pattern['name'], kwargs=kwargs)
-                except Exception as e:
-                    self.log_error(f"Failed to reverse URL '{pattern['name']}' with kwargs {kwargs}", None, e)
-                    continue
-
-                # Make request
-                try:
-                    if pattern['method'] == 'GET':
-                        response = self.client.get(url)
-                    elif pattern['method'] == 'POST':
-                        response = self.client.post(url, data)
-                    else:
-                        response = self.client.get(url)  # Default to GET
-
-                    # Check for successful response
-                    if response.status_code == 403:  # Forbidden - might be permissions issue
-                        self.log_warning(f"403 Forbidden for {pattern['name']}", url)
-                        successful_urls += 1  # Still counts as successful (permissions working)
-                    elif response.status_code >= 500:
-                        self.log_error(f"Server error ({response.status_code}) for {pattern['name']}", url, response.content.decode())
-                    elif response.status_code >= 400:
-                        self.log_warning(f"{response.status_code} error for {pattern['name']}", url)
-                        successful_urls += 1  # Client errors are expected for some cases
-                    else:
-                        successful_urls += 1
-
-                    # Check for NameError or other template errors in response content
-                    if hasattr(response, 'content'):
-                        content = response.content.decode()
-                        if 'NameError' in content or 'name \'' in content and 'is not defined' in content:
-                            self.log_error(f"NameError detected in response for {pattern['name']}", url)
-
-                    # Check for template errors
-                    if hasattr(response, 'context') and response.context:
-                        for context_var in response.context:
-                            if context_var == 'error':
-                                self.log_warning(f"Error in context for {pattern['name']}: {response.context[context_var]}", url)
-                            if 'form' in context_var.lower():
-                                form = response.context[context_var]
-                                if hasattr(form, 'errors') and form.errors:
-                                    self.log_warning(f"Form errors in {pattern['name']}: {form.errors}", url)
-
-                except Exception as e:
-                    self.log_error(f"Exception testing URL '{pattern['name']}': {type(e).__name__}", url, e)
+                ok, error, _ = self._run_one(pattern)
+                if ok:
+                    successful_urls += 1
+                self.assertIsNone(error, error)
 
         logger.info(f"📊 URL Testing Results: {successful_urls}/{tested_urls} successful")
         return successful_urls == tested_urls
 
+    def _run_one(self, pattern):
+        """Request one URL pattern; returns (ok, error, warning)"""
+        # Use the client of the appropriate logged-in user if required
+        client = self.client
+        if pattern.get('requires_auth'):
+            if pattern.get('user') == 'council_user':
+                client = self.council_client
+            else:
+                client = self.admin_client
+
+        # Get URL kwargs
+        kwargs = pattern.get('kwargs', {})
+        data = pattern.get('data', {})
+
+        # Try to reverse URL
+        try:
+            url = _cached_reverse(pattern['name'], tuple(sorted(kwargs.items())))
+        except Exception as e:
+            error = f"Failed to reverse URL '{pattern['name']}' with kwargs {kwargs}"
+            self.log_error(error, None, e)
+            return False, error, None
+
+        ok, error, warning = False, None, None
+
+        # Make request
+        try:
+            if pattern['method'] == 'GET':
+                response = client.get(url)
+            elif pattern['method'] == 'POST':
+                response = client.post(url, data)
+            else:
+                response = client.get(url)  # Default to GET
+
+            # Check for successful response
+            if response.status_code == 403:  # Forbidden - might be permissions issue
+                warning = f"403 Forbidden for {pattern['name']}"
+                self.log_warning(warning, url)
+                ok = True  # Still counts as successful (permissions working)
+            elif response.status_code >= 500:
+                error = f"Server error ({response.status_code}) for {pattern['name']}"
+                self.log_error(error, url, response.content[:2048])
+            elif response.status_code >= 400:
+                warning = f"{response.status_code} error for {pattern['name']}"
+                self.log_warning(warning, url)
+                ok = True  # Client errors are expected for some cases
+            else:
+                ok = True
+
+            # Check for NameError or other template errors in response content
+            if _NAMEERR_RE.search(response.content):
+                error = f"NameError detected in response for {pattern['name']}"
+                self.log_error(error, url)
+
+            # Check for template errors; generic views expose these under fixed keys
+            context = getattr(response, 'context', None)
+            if context:
+                error_value = context.get('error')
+                if error_value is not None:
+                    self.log_warning(f"Error in context for {pattern['name']}: {error_value}", url)
+                form = context.get('form')
+                if form is not None and getattr(form, 'errors', None):
+                    self.log_warning(f"Form errors in {pattern['name']}: {form.errors}", url)
+
+        except Exception as e:
+            error = f"Exception testing URL '{pattern['name']}': {type(e).__name__}"
+            self.log_error(error, url, e)
+            ok = False
+
+        return ok, error, warning
+
     def test_template_rendering(self):
         """Test template rendering for critical templates"""
 
         logger.info("🎨 Testing template rendering...")
 
-        # Critical templates to test
-        critical_templates = [
-            'portal/base.html',
-            'portal/ricd_dashboard.html',
-            'portal/council_dashboard.html',
-            'portal/project_detail.html',
-            'portal/user_list.html',
-            'portal/user_form.html',
-            'portal/council_form.html',
-            'portal/program_form.html',
-            'portal/project_form.html',
-        ]
-
+        critical_templates = self.CRITICAL_TEMPLATES
         successful_templates = 0
 
         for template_name in critical_templates:
             try:
-                template = get_template(template_name)
+                template = self._template(template_name)
                 # Try to render with basic context
                 context = {
                     'user': self.superuser,
@@ -425,7 +558,7 @@ class ComprehensiveURLTester(TestCase):
                 }
                 rendered = template.render(context)
 
-                if 'NameError' in rendered or 'name \'' in rendered and 'is not defined' in rendered:
+                if _NAMEERR_RE_STR.search(rendered):
                     self.log_error(f"NameError in template {template_name}")
                 else:
                     successful_templates += 1
@@ -457,7 +590,7 @@ class ComprehensiveURLTester(TestCase):
 
             # Test reverse relationships
             self.assertEqual(work.project, self.project)
-            self.assertIn(work, self.address.works.all())
+            self.assertTrue(self.address.works.filter(pk=work.pk).exists())
 
             # Test QuarterlyReport relationship
             from datetime import date
@@ -466,6 +599,9 @@ class ComprehensiveURLTester(TestCase):
                 submission_date=date(2024, 1, 1),
                 percentage_works_completed=50
             )
+            quarterly_report = QuarterlyReport.objects.select_related(
+                'work__address__project'
+            ).get(pk=quarterly_report.pk)
 
             self.assertEqual(quarterly_report.project, self.project)
             self.assertEqual(quarterly_report.work, work)
@@ -488,17 +624,12 @@ class ComprehensiveURLTester(TestCase):
 
         import_errors = []
 
-        # Test imports that are commonly problematic
-        test_imports = [
-            'from django.contrib.auth.models import User, Group',
-            'from ricd.models import Council, Program, Project',
-            'from portal.views import RICDDashboardView, CouncilDashboardView',
-            'from portal.forms import CouncilForm, ProgramForm',
-        ]
-
-        for import_stmt in test_imports:
+        for module_name, names in IMPORT_CHECKS:
+            import_stmt = f"from {module_name} import {', '.join(names)}"
             try:
-                exec(import_stmt)
+                module = importlib.import_module(module_name)
+                for name in names:
+                    getattr(module, name)
                 logger.info(f"✅ Import successful: {import_stmt}")
             except Exception as e:
                 import_errors.append(f"{import_stmt}: {e}")
@@ -4,6 +4,7 @@ Run from repo root:  python scripts/sweep_money.py
 Idempotent — running twice is a no-op (only matches `floatformat`).
 """
 
+import os
 import re
 import sys
 from pathlib import Path
@@ -20,6 +21,19 @@ MONEY_RE = re.compile(r"\$\{\{\s*([^{}|]+?)\s*\|\s*floatformat[^}]*\}\}")
 
 LOAD_TAG = "{% load money %}"
 
+SKIP_DIRS = {".git", "node_modules", "venv", ".venv", "__pycache__", ".tox"}
+
+
+def iter_templates(root: str):
+    """Yield .html paths under root; os.scandir reuses dirent type info instead of stat-ing."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from iter_templates(entry.path)
+            elif entry.name.endswith(".html"):
+                yield Path(entry.path)
+
 
 def inject_load(text: str) -> str:
     """Make sure `{% load money %}` is in the file once, after the first `{% extends %}` line."""
@@ -33,7 +47,11 @@ def inject_load(text: str) -> str:
 
 
 def sweep_file(path: Path) -> int:
-    raw = path.read_text(encoding="utf-8")
+    data = path.read_bytes()
+    # Nearly every template has no floatformat at all — skip decode + regex for those.
+    if b"floatformat" not in data:
+        return 0
+    raw = data.decode("utf-8")
     new = MONEY_RE.sub(lambda m: "{{ " + m.group(1).strip() + "|money }}", raw)
     if new == raw:
         return 0
@@ -48,7 +66,8 @@ def main() -> int:
     for root in TEMPLATE_DIRS:
         if not root.exists():
             continue
-        for html in root.rglob("*.html"):
+        # scandir yields in directory order; sort so the report is stable across runs.
+        for html in sorted(iter_templates(root)):
             n = sweep_file(html)
             if n:
                 total_files += 1
@@ -1,6 +1,6 @@
-"""Serializers for StageReport and QuarterlyReport."""
+"""Serializers for StageReport, QuarterlyReport and its grid entries."""
 from rest_framework import serializers
-from apps.core.models import StageReport, QuarterlyReport
+from apps.core.models import StageReport, QuarterlyReport, QuarterlyReportEntry
 
 
 class StageReportSerializer(serializers.ModelSerializer):
@@ -27,3 +27,20 @@ class QuarterlyReportSerializer(serializers.ModelSerializer):
             'notes', 'created_at',
         ]
         read_only_fields = ['id', 'created_at']
+
+
+class QuarterlyReportEntrySerializer(serializers.ModelSerializer):
+    """One grid cell, flattened with the labels the table needs."""
+    work_label = serializers.CharField(source='work.address', read_only=True)
+    work_type = serializers.CharField(source='work.work_type', read_only=True)
+    item_name = serializers.CharField(source='item.name', read_only=True)
+    field_type = serializers.CharField(source='item.field_type', read_only=True)
+
+    class Meta:
+        model = QuarterlyReportEntry
+        fields = [
+            'id', 'work', 'work_label', 'work_type', 'item', 'item_name', 'field_type',
+            'date_value', 'number_value', 'text_value', 'boolean_value', 'is_na',
+            'updated_at',
+        ]
+        read_only_fields = fields
@@ -3,7 +3,9 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from apps.core.models import StageReport, QuarterlyReport
-from apps.api.serializers.reports import StageReportSerializer, QuarterlyReportSerializer
+from apps.api.serializers.reports import (
+    StageReportSerializer, QuarterlyReportSerializer, QuarterlyReportEntrySerializer,
+)
 from apps.api.permissions import FNCOnlyPermission, WriteOrReadOnlyPermission, COUNCIL_ROLES, _get_role
 
 
@@ -82,13 +84,26 @@ class StageReportViewSet(viewsets.ModelViewSet):
 
 
 class QuarterlyReportViewSet(viewsets.ModelViewSet):
-    queryset = QuarterlyReport.objects.select_related('project').all()
+    queryset = QuarterlyReport.objects.select_related('council').all()
     serializer_class = QuarterlyReportSerializer
     permission_classes = [WriteOrReadOnlyPermission]
-    council_filter_field = 'project__council'
+    council_filter_field = 'council'
 
     def get_queryset(self):
-        return _council_qs(super().get_queryset(), self.request, 'project__council')
+        return _council_qs(super().get_queryset(), self.request, 'council')
+
+    @action(detail=True, methods=['get'])
+    def entries(self, request, pk=None):
+        """Grid cells one page at a time, so large councils aren't rendered in one go."""
+        report = self.get_object()
+        qs = (
+            report.entries
+            .select_related('work__address__suburb', 'work__work_type', 'item')
+            .order_by('work__project_id', 'work_id', 'item__group__order', 'item__order', 'pk')
+        )
+        page = self.paginate_queryset(qs)
+        serializer = QuarterlyReportEntrySerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=True, methods=['post'])
     def submit(self, request, pk=None):
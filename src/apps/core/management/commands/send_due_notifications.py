@@ -26,6 +26,7 @@ class Command(BaseCommand):
 
         dry = options['dry_run']
         today = datetime.date.today()
+        today_label = N._today()
         sent = 0
 
         def fire(event, *, council, project, ctx, key):
@@ -38,18 +39,18 @@ class Command(BaseCommand):
                 sent += 1
 
         # 1) Overdue Monthly Trackers (council-level)
-        for mt in MonthlyTracker.objects.select_related('council'):
-            if mt.is_overdue:
+        for mt in MonthlyTracker.objects.select_related('council__tracker_config'):
+            if mt.overdue_on(today):
                 ctx = {'council': mt.council.name, 'period': f"{mt.year}-{mt.month:02d}",
-                       'due_date': mt.due_date.strftime('%d %b %Y'), 'date': N._today()}
+                       'due_date': mt.due_date.strftime('%d %b %Y'), 'date': today_label}
                 fire('MONTHLY_TRACKER_OVERDUE', council=mt.council, project=None, ctx=ctx,
                      key=f"MONTHLY_TRACKER_OVERDUE:{mt.pk}")
 
         # 2) Overdue Quarterly Reports (council-level)
         for qr in QuarterlyReport.objects.select_related('council'):
-            if qr.is_overdue:
+            if qr.overdue_on(today):
                 ctx = {'council': qr.council.name, 'period': str(qr),
-                       'due_date': qr.due_date.strftime('%d %b %Y'), 'date': N._today()}
+                       'due_date': qr.due_date.strftime('%d %b %Y'), 'date': today_label}
                 fire('QUARTERLY_REPORT_OVERDUE', council=qr.council, project=None, ctx=ctx,
                      key=f"QUARTERLY_REPORT_OVERDUE:{qr.pk}")
 
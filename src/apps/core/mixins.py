@@ -32,6 +32,22 @@ def get_role(request):
         return None
 
 
+def is_ricd_staff(user):
+    """True for superusers and any profiled non-council role.
+
+    The answer is stored on the user instance, so the many checks made while
+    handling one request resolve the profile only once.
+    """
+    try:
+        return user._is_ricd_staff
+    except AttributeError:
+        pass
+    role = getattr(getattr(user, 'profile', None), 'officer_role', None)
+    user._is_ricd_staff = bool(
+        user.is_superuser or (role is not None and role not in COUNCIL_ROLES))
+    return user._is_ricd_staff
+
+
 class RoleRequiredMixin(LoginRequiredMixin):
     """
     Base mixin. Subclasses set `required_roles` to a frozenset of allowed role strings.
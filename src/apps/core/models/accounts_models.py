@@ -25,7 +25,7 @@ class Profile(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
-        return f"{self.user.username} - {self.council.name if self.council else 'No Council'}"
+        return f"{self.user.username} - {self.council.name if self.council_id else 'No Council'}"
 
 
 class GroupPermission(models.Model):
@@ -381,8 +381,7 @@ class FundingNotice(models.Model):
     @property
     def approved_claims_total(self):
         from decimal import Decimal
-        claims = self.claims.filter(status='APPROVED')
-        return sum((c.amount for c in claims), Decimal('0'))
+        return self.claims.filter(status='APPROVED').aggregate(t=models.Sum('amount'))['t'] or Decimal('0')
 
     @property
     def remaining(self):
@@ -679,11 +678,11 @@ class FundingSchedule(models.Model):
             child_ids.append(self.project_id)
         if not child_ids:
             return Decimal('0')
-        items = BriefFinancialApprovalItem.objects.filter(
+        total = BriefFinancialApprovalItem.objects.filter(
             bfa__status=BriefFinancialApproval.Status.APPROVED,
             project_id__in=child_ids,
-        )
-        return sum(((i.funding_amount or 0) + (i.contingency_amount or 0) for i in items), Decimal('0'))
+        ).aggregate(t=models.Sum(models.F('funding_amount') + models.F('contingency_amount')))['t']
+        return total or Decimal('0')
 
     def clean(self):
         from django.core.exceptions import ValidationError
@@ -742,10 +741,10 @@ class FundingSchedule(models.Model):
         ids = self._bfa_pool_project_ids()
         if not ids:
             return Decimal('0')
-        items = BriefFinancialApprovalItem.objects.filter(
+        total = BriefFinancialApprovalItem.objects.filter(
             bfa__status=BriefFinancialApproval.Status.APPROVED, project_id__in=ids,
-        )
-        return sum((i.funding_amount or Decimal('0') for i in items), Decimal('0'))
+        ).aggregate(t=models.Sum('funding_amount'))['t']
+        return total or Decimal('0')
 
     def has_approved_bfa(self):
         ids = self._bfa_pool_project_ids()
@@ -835,7 +834,7 @@ class FundingSchedule(models.Model):
         ]
 
     def __str__(self):
-        return f"FS#{self.schedule_number} - {self.project.name if self.project else 'No Project'} ({self.get_status_display()})"
+        return f"FS#{self.schedule_number} - {self.project.name if self.project_id else 'No Project'} ({self.get_status_display()})"
 
 
 class ProjectStateLog(models.Model):
@@ -904,8 +903,8 @@ class WorkFunding(models.Model):
                     )
 
     def __str__(self):
-        if self.work:
-            work_name = f"{self.work.work_type.name if self.work.work_type else self.work.work_type_other}"
+        if self.work_id:
+            work_name = f"{self.work.work_type.name if self.work.work_type_id else self.work.work_type_other}"
             return f"WorkFunding: {work_name} → {self.cost_centre or 'No CC'}"
         return f"WorkFunding: Project {self.project_id} → {self.cost_centre or 'No CC'}"
 
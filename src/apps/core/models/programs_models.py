@@ -78,13 +78,13 @@ class ProgramBudget(models.Model):
     def committed(self):
         """Calculate committed amount from BFA items on projects in this program/FY."""
         from apps.core.models import BriefFinancialApprovalItem
-        items = BriefFinancialApprovalItem.objects.filter(
+        total = BriefFinancialApprovalItem.objects.filter(
             bfa__status='APPROVED',
             project__program=self.program,
             project__financial_year=self.financial_year,
             project__state__in=['FUNDED', 'COMMENCED', 'UNDER_CONSTRUCTION', 'COMPLETED'],
-        )
-        return sum((i.funding_amount or 0) + (i.contingency_amount or 0) for i in items)
+        ).aggregate(t=models.Sum(models.F('funding_amount') + models.F('contingency_amount')))['t']
+        return total or 0
 
     @property
     def spent(self):
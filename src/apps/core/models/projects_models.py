@@ -1,10 +1,46 @@
+from decimal import Decimal
+
 from django.db import models
+from django.db.models import (
+    BooleanField, Case, DecimalField, OuterRef, Subquery, Sum, Value, When,
+)
+from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.urls import reverse
 
 from apps.core.utils import CURRENT_FINANCIAL_YEAR, FINANCIAL_YEAR_CHOICES
 
 
+class ProjectQuerySet(models.QuerySet):
+
+    def with_financials(self, today=None):
+        """Annotate list-page figures in the same SELECT as the projects.
+
+        * ``total_funding`` — sum of the project's FundingSchedule totals
+          (shadows the ``Project.total_funding`` cached property).
+        * ``target_date``   — completion date, else Stage 2 sunset.
+        * ``is_overdue``    — ``target_date`` is before ``today``.
+        """
+        from apps.core.models import FundingSchedule
+        today = today or timezone.localdate()
+        money = DecimalField(max_digits=14, decimal_places=2)
+        fs_total = (
+            FundingSchedule.objects.filter(project=OuterRef('pk'))
+            .order_by().values('project')
+            .annotate(t=Sum('total_funding')).values('t')
+        )
+        return self.annotate(
+            total_funding=Coalesce(Subquery(fs_total, output_field=money),
+                                   Value(Decimal('0')), output_field=money),
+            target_date=Coalesce('completion_date', 'stage2_sunset_date'),
+            is_overdue=Case(
+                When(target_date__lt=today, then=Value(True)),
+                default=Value(False), output_field=BooleanField(),
+            ),
+        )
+
+
 class Project(models.Model):
     class Type(models.TextChoices):
         DWELLING = 'DWELLING', 'Dwelling'
@@ -209,6 +245,8 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProjectQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
@@ -378,11 +416,23 @@ class Project(models.Model):
             if getattr(self, f) != getattr(fs, f):
                 return False
         return True
+
+    @cached_property
+    def total_funding(self):
+        """Sum of total_funding across this project's funding schedules.
+
+        Cached on the instance, so pages that show it in several places pay for
+        one query; prefetched ``funding_schedules`` are summed without one.
+        """
+        prefetched = getattr(self, '_prefetched_objects_cache', {})
+        if 'funding_schedules' in prefetched:
+            return sum((fs.total_funding or Decimal('0') for fs in prefetched['funding_schedules']),
+                       Decimal('0'))
+        return self.funding_schedules.aggregate(t=Sum('total_funding'))['t'] or Decimal('0')
     
     def active_funding_schedule(self):
         """Returns the ACTIVE funding schedule for this project (from reverse relation)"""
-        fs_list = self.funding_schedules.filter(status='ACTIVE')
-        return fs_list.first() if fs_list else None
+        return self.funding_schedules.filter(status='ACTIVE').first()
     
     @property
     def active_funding_schedule_obj(self):
@@ -411,7 +461,7 @@ class Project(models.Model):
                     desc_parts.append(w.description)
                 elif w.work_type_other:
                     desc_parts.append(w.work_type_other)
-                elif w.work_type:
+                elif w.work_type_id:
                     desc_parts.append(str(w.work_type))
             return "; ".join(desc_parts)
         return ""
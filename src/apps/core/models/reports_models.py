@@ -1,5 +1,7 @@
 from django.db import models
 
+from apps.core.utils import add_months
+
 
 class CouncilTrackerConfig(models.Model):
     """Per-council configuration for the monthly tracker (set in Maintenance)."""
@@ -64,14 +66,17 @@ class MonthlyTracker(models.Model):
             due_day = self.council.tracker_config.submission_due_day
         except Exception:
             due_day = 8
-        if self.month == 12:
-            return datetime.date(self.year + 1, 1, due_day)
-        return datetime.date(self.year, self.month + 1, due_day)
+        return add_months(datetime.date(self.year, self.month, 1), 1).replace(day=due_day)
+
+    def overdue_on(self, today=None):
+        """True when still DRAFT after the due date. Pass ``today`` when checking many."""
+        import datetime
+        today = today or datetime.date.today()
+        return today > self.due_date and self.status == self.Status.DRAFT
 
     @property
     def is_overdue(self):
-        import datetime
-        return datetime.date.today() > self.due_date and self.status == self.Status.DRAFT
+        return self.overdue_on()
 
 
 class MonthlyTrackerWorkEntry(models.Model):
@@ -273,18 +278,18 @@ class QuarterlyReport(models.Model):
     def due_date(self):
         """14 days after quarter end."""
         import datetime
-        end_month = self.quarter * 3
-        end_year = self.year
-        if end_month == 12:
-            next_month_start = datetime.date(end_year + 1, 1, 1)
-        else:
-            next_month_start = datetime.date(end_year, end_month + 1, 1)
+        next_month_start = add_months(datetime.date(self.year, self.quarter * 3, 1), 1)
         return next_month_start + datetime.timedelta(days=13)  # 14 days inclusive
 
+    def overdue_on(self, today=None):
+        """True when not yet approved after the due date. Pass ``today`` when checking many."""
+        import datetime
+        today = today or datetime.date.today()
+        return today > self.due_date and self.status != self.Status.APPROVED
+
     @property
     def is_overdue(self):
-        import datetime
-        return datetime.date.today() > self.due_date and self.status != self.Status.APPROVED
+        return self.overdue_on()
 
 
 class QuarterlyReportEntry(models.Model):
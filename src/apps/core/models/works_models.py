@@ -306,7 +306,7 @@ class Work(models.Model):
         return forecast > sunset + timedelta(days=30)
 
     def __str__(self):
-        work_type_display = self.work_type.name if self.work_type else self.work_type_other
+        work_type_display = self.work_type.name if self.work_type_id else self.work_type_other
         bedroom_str = f", {self.bedrooms}BR" if self.bedrooms else ""
         return f"{work_type_display}{bedroom_str} x {self.quantity} for {self.project.name}"
 
@@ -335,12 +335,12 @@ class Work(models.Model):
 
     def calculate_notional_cost(self):
         """Calculate cost based on notional rates for the project's financial year"""
-        if not self.work_type:
+        if not self.work_type_id:
             return None
         
         financial_year = None
         
-        if self.project:
+        if self.project_id:
             financial_year = getattr(self.project, 'financial_year', None)
         
         if not financial_year:
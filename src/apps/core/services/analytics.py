@@ -63,16 +63,19 @@ def build_aggregate_outputs(region=None):
     Args:
         region: optional council region string to scope to.
     """
-    projects = Project.objects.filter(is_archived=False).select_related('council')
+    # Only the columns the aggregation reads are fetched (tuples / deferred
+    # models), not full Project/Work/allocation rows.
+    projects = Project.objects.filter(is_archived=False)
     if region:
         projects = projects.filter(council__region=region)
 
     pmeta = {}
-    for p in projects:
-        pmeta[p.pk] = {
-            'council': p.council.name if p.council_id else '—',
-            'region': (p.council.region if (p.council_id and p.council.region) else '—'),
-            'stage': _STATE_STAGE.get(p.state),
+    for pk, state, council_name, council_region in projects.values_list(
+            'pk', 'state', 'council__name', 'council__region'):
+        pmeta[pk] = {
+            'council': council_name or '—',
+            'region': council_region or '—',
+            'stage': _STATE_STAGE.get(state),
         }
     pids = list(pmeta)
     if not pids:
@@ -82,7 +85,10 @@ def build_aggregate_outputs(region=None):
     proj_cat_units = defaultdict(lambda: defaultdict(float))   # pid -> cat -> units
     proj_cat_cost = defaultdict(lambda: defaultdict(float))    # pid -> cat -> cost
     mix = defaultdict(lambda: defaultdict(lambda: defaultdict(float)))  # cat -> (name,beds) -> stage -> units
-    for w in Work.objects.filter(project_id__in=pids).select_related('work_type'):
+    works = (Work.objects.filter(project_id__in=pids).select_related('work_type')
+             .only('project_id', 'quantity', 'bedrooms', 'estimated_cost', 'actual_cost',
+                   'is_notional_cost', 'work_type__name', 'work_type__category'))
+    for w in works:
         wt = w.work_type
         cat = _WT_TO_CAT.get(wt.category) if wt else None
         if cat is None:
@@ -101,13 +107,15 @@ def build_aggregate_outputs(region=None):
 
     # Approved BFA funding + released allocations, per project per program.
     fund = defaultdict(lambda: defaultdict(float))   # pid -> progid -> approved $
-    for it in (BriefFinancialApprovalItem.objects
-               .filter(bfa__status='APPROVED', project_id__in=pids)):
-        fund[it.project_id][it.program_id] += float(it.funding_amount or 0)
+    for pid, progid, amount in (BriefFinancialApprovalItem.objects
+                                .filter(bfa__status='APPROVED', project_id__in=pids)
+                                .values_list('project_id', 'program_id', 'funding_amount')):
+        fund[pid][progid] += float(amount or 0)
     paid = defaultdict(lambda: defaultdict(float))   # pid -> progid -> paid $
-    for a in (PaymentAllocation.objects
-              .filter(payment__project_id__in=pids).select_related('payment')):
-        paid[a.payment.project_id][a.program_id] += float(a.amount or 0)
+    for pid, progid, amount in (PaymentAllocation.objects
+                                .filter(payment__project_id__in=pids)
+                                .values_list('payment__project_id', 'program_id', 'amount')):
+        paid[pid][progid] += float(amount or 0)
 
     prog_ids = set()
     for d in fund.values():
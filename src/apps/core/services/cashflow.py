@@ -20,7 +20,7 @@ from collections import defaultdict
 from decimal import Decimal
 
 from apps.core.models import Payment, ProgramBudget, Project
-from apps.core.utils import date_to_financial_year
+from apps.core.utils import InvalidPeriod, date_to_financial_year, month_keys, parse_year_month
 
 
 def _zero():
@@ -169,21 +169,15 @@ def build_program_monthly_cashflow(program=None, councils=None, start=None, mont
 
     if start:
         try:
-            sy, sm = (int(x) for x in str(start).split('-')[:2])
-        except (ValueError, TypeError):
+            sy, sm = parse_year_month(start)
+        except InvalidPeriod:
             t = datetime.date.today(); sy, sm = t.year, t.month
     else:
         t = datetime.date.today(); sy, sm = t.year, t.month
     months = max(1, min(int(months or 24), 60))
     start = f"{sy}-{sm:02d}"
 
-    month_set = set()
-    y, m = sy, sm
-    for _ in range(months):
-        month_set.add(f"{y}-{m:02d}")
-        m += 1
-        if m > 12:
-            m = 1; y += 1
+    month_set = set(month_keys(sy, sm, months))
 
     payments = (Payment.objects
                 .select_related('project__program', 'project__council')
@@ -18,8 +18,10 @@ from django.http import HttpResponse
 
 from apps.core.services.analytics import build_aggregate_outputs, CATS, CAT_LABEL
 from apps.core.services.cashflow import build_program_monthly_cashflow
+from apps.core.utils import month_keys, parse_year_month
 
 XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+WORK_ITEMS_CHUNK_SIZE = 500
 
 
 # ── shared row builders ──────────────────────────────────────────────
@@ -63,7 +65,9 @@ def work_items_rows(council=None, include_archived=False):
     )
 
     rows = []
-    for wk in works:
+    # Stream in chunks (steps are prefetched per chunk) so a full-portfolio dump
+    # doesn't hold every Work instance in memory alongside the built rows.
+    for wk in works.iterator(chunk_size=WORK_ITEMS_CHUNK_SIZE):
         p = wk.project
         steps = [s for s in wk.steps.all() if s.is_active]
         done = [s for s in steps if s.completed or s.actual_completion_date]
@@ -135,14 +139,8 @@ def cashflow_monthly_sheet(start=None, months=24):
     data = build_program_monthly_cashflow(start=start, months=months)
     headers = ['Program', 'CC', 'GL', 'Month', 'Forecast', 'Released']
     progs = {p['id']: p for p in data['programs']}
-    sy, sm = (int(x) for x in data['start'].split('-'))
-    keys = []
-    y, m = sy, sm
-    for _ in range(data['months']):
-        keys.append(f"{y}-{m:02d}")
-        m += 1
-        if m > 12:
-            m = 1; y += 1
+    sy, sm = parse_year_month(data['start'])
+    keys = month_keys(sy, sm, data['months'])
     rows = []
     for pid, p in progs.items():
         for k in keys:
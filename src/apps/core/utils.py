@@ -1,6 +1,7 @@
 """
 Common utilities for FNC system.
 """
+import calendar
 from datetime import datetime
 
 
@@ -34,6 +35,45 @@ def date_to_financial_year(d):
     return f"{start_year}-{start_year + 1}"
 
 
+class InvalidPeriod(ValueError):
+    """Raised by ``parse_year_month`` for a malformed "YYYY-MM" period."""
+
+
+def parse_year_month(value):
+    """Parse "YYYY-MM" (anything after the month, e.g. "-DD", is ignored) to (year, month).
+
+    Fixed-position slicing rather than split/strptime. Raises InvalidPeriod.
+    """
+    value = str(value or '')
+    try:
+        if value[4] != '-':
+            raise InvalidPeriod(f"Expected YYYY-MM, got {value!r}")
+        year, month = int(value[:4]), int(value[5:7])
+    except (IndexError, ValueError):
+        raise InvalidPeriod(f"Expected YYYY-MM, got {value!r}") from None
+    if not 1 <= month <= 12:
+        raise InvalidPeriod(f"Month out of range in {value!r}")
+    return year, month
+
+
+def add_months(d, n):
+    """Return ``d`` shifted by ``n`` calendar months (n may be negative).
+
+    The day is clamped to the target month's length, so 31 Jan + 1 month is
+    28/29 Feb. Plain integer arithmetic — cheap enough for per-row month loops.
+    """
+    m = d.month - 1 + n
+    year, month = d.year + m // 12, m % 12 + 1
+    return d.replace(year=year, month=month,
+                     day=min(d.day, calendar.monthrange(year, month)[1]))
+
+
+def month_keys(year, month, count):
+    """Return ``count`` consecutive "YYYY-MM" keys starting at year/month."""
+    m0 = year * 12 + month - 1
+    return [f"{m // 12}-{m % 12 + 1:02d}" for m in range(m0, m0 + count)]
+
+
 def get_financial_year_choices(start_year=2025, num_years=10):
     """
     Generate financial year choices for dropdowns.
@@ -601,6 +601,13 @@ class ProjectDetailView(CouncilScopedMixin, CouncilOrFNCMixin, CommentsMixin, No
     template_name = 'projects/detail.html'
     context_object_name = 'project'
 
+    def get_queryset(self):
+        # The header and overview tabs read every one of these FKs.
+        return super().get_queryset().select_related(
+            'council', 'program', 'funding_schedule', 'lead_officer',
+            'principal_officer', 'senior_officer', 'parent_land_project',
+        )
+
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         ctx['active_tab'] = self.request.GET.get('tab', 'overview')
@@ -841,13 +848,19 @@ class ProjectTransferWorksView(WriteRequiredMixin, View):
             w.save(update_fields=['project', 'updated_at'])
             moved.add(w.pk)
 
-        for w in Work.objects.filter(pk__in=work_ids, project=source).select_related('address'):
+        selected = list(Work.objects.filter(pk__in=work_ids, project=source))
+        address_ids = {w.address_id for w in selected if w.address_id}
+        # Addresses move in one UPDATE; their works are fetched in one query
+        # and grouped by address rather than looked up per selected work.
+        Address.objects.filter(pk__in=address_ids).exclude(project=target).update(project=target)
+        siblings = {}
+        for sib in Work.objects.filter(address_id__in=address_ids).order_by('id'):
+            siblings.setdefault(sib.address_id, []).append(sib)
+
+        for w in selected:
             _move(w)
-            if w.address_id:
-                if w.address.project_id != target.pk:
-                    Address.objects.filter(pk=w.address_id).update(project=target)
-                for sib in Work.objects.filter(address_id=w.address_id):
-                    _move(sib)
+            for sib in siblings.get(w.address_id, []):
+                _move(sib)
 
         messages.success(
             request,
@@ -1273,10 +1286,13 @@ class FundingScheduleContractReportView(CouncilScopedMixin, CouncilOrFNCMixin, N
 
         # ── Lifecycle health ─────────────────────────────────────────────
         today = date.today()
-        works = Work.objects.filter(project_id__in=child_ids).select_related('project', 'work_type', 'address')
-        work_total = works.count()
-        work_pc_complete = works.filter(practical_completion_date__isnull=False).count()
-        work_handover_complete = works.filter(handover_date__isnull=False).count()
+        # Materialised once: the sunset scan needs every row, so count in Python.
+        works = list(
+            Work.objects.filter(project_id__in=child_ids).select_related('project', 'work_type', 'address')
+        )
+        work_total = len(works)
+        work_pc_complete = sum(1 for w in works if w.practical_completion_date is not None)
+        work_handover_complete = sum(1 for w in works if w.handover_date is not None)
         sunset_breach = [
             w for w in works
             if w.forecast_practical_completion_date and w.project.stage2_sunset_date
@@ -1,6 +1,6 @@
 from datetime import date
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count, Sum
+from django.db.models import Count, Q, Sum
 from django.shortcuts import render
 
 from apps.core.models import (
@@ -40,24 +40,27 @@ def dashboard_view(request):
     if status_filter:
         projects = projects.filter(status_flag=status_filter)
 
-    total_projects = projects.count()
-    late_projects = projects.filter(status_flag=Project.StatusFlag.LATE).count()
-    overdue_projects = projects.filter(status_flag=Project.StatusFlag.OVERDUE).count()
-    on_track_projects = projects.filter(status_flag=Project.StatusFlag.ON_TRACK).count()
+    # All headline counts in one pass over the filtered projects.
+    counts = projects.aggregate(
+        total=Count('id'),
+        late=Count('id', filter=Q(status_flag=Project.StatusFlag.LATE)),
+        overdue=Count('id', filter=Q(status_flag=Project.StatusFlag.OVERDUE)),
+        on_track=Count('id', filter=Q(status_flag=Project.StatusFlag.ON_TRACK)),
+        active=Count('id', filter=~Q(state__in=[Project.State.COMPLETED, 'CANCELLED'])),
+    )
     total_budget = (
         FundingSchedule.objects.filter(project__in=projects)
         .aggregate(total=Sum('total_funding'))['total'] or 0
     )
-    active_projects = projects.exclude(state__in=[Project.State.COMPLETED, 'CANCELLED']).count()
     projects_by_state = projects.values('state').annotate(count=Count('id'))
 
     return render(request, 'dashboard/dashboard.html', {
         'projects': projects,
-        'total_projects': total_projects,
-        'active_projects': active_projects,
-        'late_projects': late_projects,
-        'overdue_projects': overdue_projects,
-        'on_track_projects': on_track_projects,
+        'total_projects': counts['total'],
+        'active_projects': counts['active'],
+        'late_projects': counts['late'],
+        'overdue_projects': counts['overdue'],
+        'on_track_projects': counts['on_track'],
         'total_budget': total_budget,
         'projects_by_state': projects_by_state,
         'councils': Council.objects.all().order_by('name'),
@@ -234,10 +237,12 @@ def projects_board_view(request):
     council_id = request.GET.get('council')
     financial_year = request.GET.get('financial_year')
 
+    today = date.today()
+
     projects = (
         Project.objects
         .select_related('council', 'program')
-        .prefetch_related('funding_schedules')
+        .with_financials(today=today)
         .order_by('name')
     )
     if program_id:
@@ -247,19 +252,13 @@ def projects_board_view(request):
     if financial_year:
         projects = projects.filter(financial_year=financial_year)
 
-    today = date.today()
-
     def _card(project):
-        total_funding = (
-            project.funding_schedules.aggregate(t=Sum('total_funding'))['t'] or 0
-        )
-        target = project.completion_date or project.stage2_sunset_date
-        days_left = (target - today).days if target else None
+        target = project.target_date
         return {
             'project': project,
-            'total_funding': total_funding,
-            'days_left': days_left,
-            'overdue': days_left is not None and days_left < 0,
+            'total_funding': project.total_funding,
+            'days_left': (target - today).days if target else None,
+            'overdue': project.is_overdue,
         }
 
     column_order = [
@@ -7,6 +7,10 @@ from django.contrib.auth.decorators import login_required
 from django.db.models import Sum
 from django.http import HttpResponse
 from apps.core.models import StageReport, QuarterlyReport, Project, Council, Payment
+from apps.core.utils import InvalidPeriod, parse_year_month
+
+# Rows fetched per round trip when a CSV export streams a queryset.
+CSV_CHUNK_SIZE = 500
 
 
 @login_required
@@ -20,17 +24,13 @@ def reports_dashboard_view(request):
     stage_reports = StageReport.objects.select_related('project')
     quarterly_reports = QuarterlyReport.objects.select_related('council')
 
+    if project_id and not project_id.isdigit():
+        project_id = ''
     if project_id:
         stage_reports = stage_reports.filter(project_id=project_id)
-        # QR no longer has a project FK; filter by the project's council
-        try:
-            council_id_for_project = Project.objects.filter(pk=project_id).values_list('council_id', flat=True).first()
-            if council_id_for_project:
-                quarterly_reports = quarterly_reports.filter(council_id=council_id_for_project)
-            else:
-                quarterly_reports = quarterly_reports.none()
-        except Exception:
-            quarterly_reports = quarterly_reports.none()
+        # QR no longer has a project FK; filter by the project's council in the
+        # same query (an unknown project simply matches nothing).
+        quarterly_reports = quarterly_reports.filter(council__projects__pk=project_id)
     if status_filter:
         stage_reports = stage_reports.filter(status=status_filter)
         quarterly_reports = quarterly_reports.filter(status=status_filter)
@@ -117,10 +117,8 @@ def _eom_resolve_month(request):
     today = datetime.date.today()
     if raw:
         try:
-            y, m = raw.split('-')
-            year, month = int(y), int(m)
-            datetime.date(year, month, 1)  # validate
-        except (ValueError, TypeError):
+            year, month = parse_year_month(raw)
+        except InvalidPeriod:
             year, month = today.year, today.month
     else:
         year, month = today.year, today.month
@@ -149,7 +147,7 @@ def _eom_rows_for_month(year, month):
         )
         .order_by('payment__project__council__name', 'program__name', 'payment__release_date')
     )
-    for alloc in qs:
+    for alloc in qs.iterator(chunk_size=CSV_CHUNK_SIZE):
         p = alloc.payment
         prog = alloc.program or p.project.program
         yield {
@@ -215,7 +213,6 @@ def eom_reconciliation_view(request):
 def eom_reconciliation_export(request):
     """CSV export of the EOM reconciliation for ?month=YYYY-MM."""
     year, month, label = _eom_resolve_month(request)
-    rows = list(_eom_rows_for_month(year, month))
 
     response = HttpResponse(content_type='text/csv')
     response['Content-Disposition'] = (
@@ -227,7 +224,9 @@ def eom_reconciliation_export(request):
         'Cost Centre', 'GL Code', 'Payment Type',
         'Amount', 'Ratio', 'SAP Reference', 'Tax Invoice Reference',
     ])
-    for r in rows:
+    total = Decimal('0')
+    for r in _eom_rows_for_month(year, month):
+        total += r['amount']
         writer.writerow([
             r['release_date'].isoformat() if r['release_date'] else '',
             r['council'], r['project'], r['fs_number'],
@@ -238,7 +237,6 @@ def eom_reconciliation_export(request):
             r['sap_ref'], r['tax_invoice_ref'],
         ])
     # Grand total footer
-    total = sum((r['amount'] for r in rows), Decimal('0'))
     writer.writerow([])
     writer.writerow(['', '', '', '', '', '', '', 'TOTAL', f"{total:.2f}", '', '', ''])
     return response
@@ -310,7 +308,7 @@ def construction_creation_list_view(request):
 @login_required
 def construction_creation_list_export(request):
     """CSV export of the Construction Creation List."""
-    works = list(_ccl_queryset(request))
+    works = _ccl_queryset(request).iterator(chunk_size=CSV_CHUNK_SIZE)
 
     response = HttpResponse(content_type='text/csv')
     today = datetime.date.today().isoformat()
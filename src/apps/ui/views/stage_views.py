@@ -30,6 +30,7 @@ from django.views.generic import (
     View, ListView, CreateView, UpdateView, DeleteView
 )
 
+from apps.core.mixins import is_ricd_staff as _is_ricd_staff
 from apps.core.models import (
     CouncilTrackerConfig,
     Project,
@@ -53,13 +54,6 @@ def _is_council_user(user):
     return _role(user) in COUNCIL_ROLES
 
 
-def _is_ricd_staff(user):
-    if user.is_superuser:
-        return True
-    r = _role(user)
-    return r is not None and r not in COUNCIL_ROLES
-
-
 def _is_manager(user):
     return user.is_superuser or _role(user) in MANAGER_ROLES
 
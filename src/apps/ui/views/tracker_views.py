@@ -12,6 +12,7 @@ Access rules:
 - Council users see their own council only, can edit when status=DRAFT
   AND the council's CouncilTrackerConfig.council_submission_enabled is True
 """
+from collections import defaultdict
 from datetime import date
 
 from django.contrib import messages
@@ -21,6 +22,7 @@ from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 from django.views.generic import View
 
+from apps.core.mixins import is_ricd_staff as _is_ricd_staff
 from apps.core.models import (
     Council, CouncilTrackerConfig, FundingSchedule,
     MonthlyTracker, MonthlyTrackerWorkEntry,
@@ -44,13 +46,6 @@ def _user_council(user):
     return getattr(getattr(user, 'profile', None), 'council', None)
 
 
-def _is_ricd_staff(user):
-    if user.is_superuser:
-        return True
-    role = _role(user)
-    return role is not None and role not in COUNCIL_ROLES
-
-
 def _active_projects_for_council(council):
     """Projects in COMMENCED or UNDER_CONSTRUCTION state for this council."""
     return Project.objects.filter(
@@ -59,6 +54,42 @@ def _active_projects_for_council(council):
     )
 
 
+def _active_schedules_for_council(council):
+    """ACTIVE FundingSchedules for this council — the quarterly report's sections."""
+    return FundingSchedule.objects.filter(
+        council=council,
+        status=FundingSchedule.Status.ACTIVE,
+    )
+
+
+def _quarterly_report_projects(active_fs):
+    """Projects on the given schedules that report quarterly (in construction, not QBuild)."""
+    return Project.objects.filter(
+        funding_schedule__in=active_fs,
+        state__in=[Project.State.COMMENCED, Project.State.UNDER_CONSTRUCTION],
+    ).exclude(qbuild_delivered=True)
+
+
+def _quarterly_items_lookup():
+    """Load active QR items once; return ``items_for(project)`` giving a project's columns.
+
+    A project with an assigned item group gets that group's items, otherwise
+    every active item (ordered by group, then item order).
+    """
+    all_items = list(QuarterlyReportItem.objects.filter(
+        is_active=True,
+    ).select_related('group').order_by('group__order', 'order'))
+    by_group = defaultdict(list)
+    for item in all_items:
+        by_group[item.group_id].append(item)
+
+    def items_for(project):
+        if project.quarterly_report_item_group_id:
+            return by_group.get(project.quarterly_report_item_group_id, [])
+        return all_items
+    return items_for
+
+
 # ===========================================================================
 # CouncilTrackerConfig (maintenance UI)
 # ===========================================================================
@@ -103,13 +134,18 @@ class CouncilTrackerConfigUpdateView(LoginRequiredMixin, View):
         if not _is_ricd_staff(request.user):
             messages.error(request, "Only RICD staff can edit tracker configuration.")
             return redirect('ui:dashboard')
-        council, cfg = self._get_config(council_pk)
-        cfg.council_submission_enabled = request.POST.get('council_submission_enabled') == 'on'
+        council = get_object_or_404(Council, pk=council_pk)
         try:
-            cfg.submission_due_day = int(request.POST.get('submission_due_day', 8))
+            due_day = int(request.POST.get('submission_due_day', 8))
         except ValueError:
-            cfg.submission_due_day = 8
-        cfg.save()
+            due_day = 8
+        CouncilTrackerConfig.objects.update_or_create(
+            council=council,
+            defaults={
+                'council_submission_enabled': request.POST.get('council_submission_enabled') == 'on',
+                'submission_due_day': due_day,
+            },
+        )
         messages.success(request, f'Saved tracker config for {council.name}.')
         return redirect('ui:tracker_config_list')
 
@@ -171,16 +207,20 @@ class MonthlyTrackerOpenOrCreateView(LoginRequiredMixin, View):
             work__in=works,
             group_item__is_monthly_tracker_column=True,
             is_active=True,
-        ).select_related('work', 'group_item')
-
-        for step in steps:
-            MonthlyTrackerWorkEntry.objects.get_or_create(
-                tracker=tracker, work_step=step,
-                defaults={
-                    'actual_completion_date': step.actual_completion_date,
-                    'forecast_completion_date': step.forecast_completion_date,
-                },
-            )
+        ).values_list('pk', 'actual_completion_date', 'forecast_completion_date')
+
+        # Existing (tracker, work_step) rows are skipped by the unique constraint.
+        MonthlyTrackerWorkEntry.objects.bulk_create(
+            [
+                MonthlyTrackerWorkEntry(
+                    tracker=tracker, work_step_id=step_id,
+                    actual_completion_date=actual,
+                    forecast_completion_date=forecast,
+                )
+                for step_id, actual, forecast in steps
+            ],
+            batch_size=1000, ignore_conflicts=True,
+        )
 
 
 class MonthlyTrackerDetailView(LoginRequiredMixin, View):
@@ -263,17 +303,19 @@ class MonthlyTrackerDetailView(LoginRequiredMixin, View):
             return redirect('ui:monthly_tracker_detail', pk=pk)
 
         updated = 0
-        for e in tracker.work_entries.all():
+        today = date.today()
+        # Only the entries and their WorkSteps (synced on save) are needed to
+        # write; the grid built by get() is never assembled on POST.
+        for e in tracker.work_entries.select_related('work_step'):
             actual_field = f'entry_{e.pk}_actual'
             forecast_field = f'entry_{e.pk}_forecast'
-            new_actual = date.today() if request.POST.get(actual_field) == 'on' else None
+            new_actual = today if request.POST.get(actual_field) == 'on' else None
 
             raw_forecast = request.POST.get(forecast_field) or ''
             new_forecast = None
             if raw_forecast:
                 try:
-                    from datetime import datetime
-                    new_forecast = datetime.strptime(raw_forecast, '%Y-%m-%d').date()
+                    new_forecast = date.fromisoformat(raw_forecast)
                 except ValueError:
                     new_forecast = None
 
@@ -383,31 +425,20 @@ class QuarterlyReportOpenOrCreateView(LoginRequiredMixin, View):
 
     def _sync_entries(self, report):
         """Pre-create blank entries for Works on Active FSes, using each project's assigned item group."""
-        active_fs = FundingSchedule.objects.filter(
-            council=report.council,
-            status=FundingSchedule.Status.ACTIVE,
+        items_for = _quarterly_items_lookup()
+        projects = {
+            p.pk: p for p in
+            _quarterly_report_projects(_active_schedules_for_council(report.council))
+        }
+        works = Work.objects.filter(project__in=projects.keys()).values_list('pk', 'project_id')
+        QuarterlyReportEntry.objects.bulk_create(
+            [
+                QuarterlyReportEntry(report=report, work_id=work_id, item=item)
+                for work_id, project_id in works
+                for item in items_for(projects[project_id])
+            ],
+            batch_size=1000, ignore_conflicts=True,
         )
-        projects = Project.objects.filter(
-            funding_schedule__in=active_fs,
-            state__in=[Project.State.COMMENCED, Project.State.UNDER_CONSTRUCTION],
-        ).exclude(qbuild_delivered=True).select_related('quarterly_report_item_group')
-
-        for project in projects:
-            if project.quarterly_report_item_group_id:
-                items = list(QuarterlyReportItem.objects.filter(
-                    group=project.quarterly_report_item_group,
-                    is_active=True,
-                ).order_by('order'))
-            else:
-                items = list(QuarterlyReportItem.objects.filter(
-                    is_active=True,
-                ).order_by('group__order', 'order'))
-            works = Work.objects.filter(project=project)
-            for work in works:
-                for item in items:
-                    QuarterlyReportEntry.objects.get_or_create(
-                        report=report, work=work, item=item,
-                    )
 
 
 class QuarterlyReportDetailView(LoginRequiredMixin, View):
@@ -431,45 +462,38 @@ class QuarterlyReportDetailView(LoginRequiredMixin, View):
         return False
 
     def _build_grid(self, report):
-        """Return FS→Project→Works hierarchy; each project uses its own QR item group columns."""
-        # Pre-load all entries for this report into a lookup dict
-        entries = report.entries.select_related(
-            'work__project__funding_schedule',
-            'work__address',
-            'item__group',
-        ).all()
-        cell = {}
-        for e in entries:
-            cell[(e.work_id, e.item_id)] = e
+        """Return FS→Project→Works hierarchy; each project uses its own QR item group columns.
 
-        active_fs = FundingSchedule.objects.filter(
-            council=report.council,
-            status=FundingSchedule.Status.ACTIVE,
-        ).order_by('schedule_number')
+        Entries, projects, works and items are each fetched once for the whole
+        report and joined here, so the query count doesn't grow with the grid.
+        """
+        cell = {(e.work_id, e.item_id): e for e in report.entries.all()}
+
+        active_fs = list(_active_schedules_for_council(report.council)
+                         .select_related('funding_agreement').order_by('schedule_number'))
+
+        projects_by_fs = defaultdict(list)
+        for project in _quarterly_report_projects(active_fs).order_by('name'):
+            projects_by_fs[project.funding_schedule_id].append(project)
+
+        works_by_project = defaultdict(list)
+        works = (Work.objects
+                 .filter(project__in=[p for ps in projects_by_fs.values() for p in ps])
+                 .select_related('address', 'work_type').order_by('id'))
+        for work in works:
+            works_by_project[work.project_id].append(work)
+
+        items_for = _quarterly_items_lookup()
 
         fs_sections = []
         for fs in active_fs:
-            projects = Project.objects.filter(
-                funding_schedule=fs,
-                state__in=[Project.State.COMMENCED, Project.State.UNDER_CONSTRUCTION],
-            ).exclude(qbuild_delivered=True).select_related('quarterly_report_item_group').order_by('name')
-
             project_sections = []
-            for project in projects:
-                if project.quarterly_report_item_group_id:
-                    items = list(QuarterlyReportItem.objects.filter(
-                        group=project.quarterly_report_item_group,
-                        is_active=True,
-                    ).select_related('group').order_by('order'))
-                else:
-                    items = list(QuarterlyReportItem.objects.filter(
-                        is_active=True,
-                    ).select_related('group').order_by('group__order', 'order'))
+            for project in projects_by_fs.get(fs.pk, []):
+                items = items_for(project)
 
-                works = Work.objects.filter(project=project).order_by('id')
                 work_rows = []
-                for work in works:
-                    addr = getattr(work, 'address', None)
+                for work in works_by_project.get(project.pk, []):
+                    addr = work.address
                     if addr:
                         addr_str = f"{addr.street}" + (
                             f" (Lot {addr.lot} {addr.plan})" if getattr(addr, 'lot', None) else ""
@@ -551,8 +575,7 @@ class QuarterlyReportDetailView(LoginRequiredMixin, View):
                 new_date = None
                 if raw and not na:
                     try:
-                        from datetime import datetime
-                        new_date = datetime.strptime(raw, '%Y-%m-%d').date()
+                        new_date = date.fromisoformat(raw)
                     except ValueError:
                         new_date = None
                 if e.date_value != new_date or e.is_na != na:
@@ -599,8 +622,7 @@ class QuarterlyReportDetailView(LoginRequiredMixin, View):
         decl_date_raw = request.POST.get('declaration_date', '')
         if decl_date_raw:
             try:
-                from datetime import datetime
-                new_decl_date = datetime.strptime(decl_date_raw, '%Y-%m-%d').date()
+                new_decl_date = date.fromisoformat(decl_date_raw)
             except ValueError:
                 new_decl_date = report.declaration_date
         else:
@@ -85,9 +85,14 @@ TEMPLATES = [
                 'django.contrib.messages.context_processors.messages',
                 'apps.core.context_processors.ricd_user_context',
             ],
+            # Listing loaders explicitly switches off Django's default cached
+            # loader, so wrap them in it here. The runserver autoreloader still
+            # resets the cache when a template file changes.
             'loaders': [
-                'django.template.loaders.filesystem.Loader',
-                'django.template.loaders.app_directories.Loader',
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
             ],
         },
     },
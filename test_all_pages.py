@@ -5,14 +5,47 @@ Tests all URLs from portal/urls.py and documents failures
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import threading
+import time
 from urllib.parse import urljoin
 import json
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder produces the same file
+    orjson = None
 
 BASE_URL = "http://192.168.5.64:8000"
 LOGIN_URL = f"{BASE_URL}/accounts/login/"
 
+# Login form token; bytes pattern so the page never needs decoding to find it
+_CSRF_RE = re.compile(rb'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+# Bytes of each page body read back; Django tracebacks sit well inside this
+BODY_READ_LIMIT = 64 * 1024
+
+# Pages requested at once across all users; keeps the dev server from being swamped
+MAX_CONCURRENT_REQUESTS = 10
+
+# Users are tested in parallel, each with its own worker pool; page fetches from
+# every tester share this one budget
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Users are tested in parallel; keep each printed line whole
+_PRINT_LOCK = threading.Lock()
+
+
+def _log(*args, **kwargs):
+    with _PRINT_LOCK:
+        print(*args, **kwargs)
+
+
 # Test user configurations
 TEST_USERS = [
     {
@@ -30,7 +63,8 @@ TEST_USERS = [
 ]
 
 # URLs that require authentication - expanded comprehensive list
-PROTECTED_URLS = [
+# (dict.fromkeys drops accidental duplicates while keeping order)
+PROTECTED_URLS = tuple(dict.fromkeys([
     "/portal/ricd/",
     "/portal/council/",
     "/portal/projects/",
@@ -62,21 +96,90 @@ PROTECTED_URLS = [
     "/portal/reports/enhanced-stage2/",
     "/portal/reports/monthly/",
     "/portal/reports/quarterly/",
-]
+]))
 
 # URLs that might work without auth
-PUBLIC_URLS = [
+PUBLIC_URLS = tuple(dict.fromkeys([
     "/",
     "/accounts/login/",
-]
+]))
+
+assert not set(PROTECTED_URLS) & set(PUBLIC_URLS), \
+    f"URLs listed as both protected and public: {sorted(set(PROTECTED_URLS) & set(PUBLIC_URLS))}"
 
 class PageTester:
     def __init__(self, user_config):
         self.user_config = user_config
-        self.session = requests.Session()
+        self.session = self._new_session()
+        # Protected-page workers each get their own Session; requests.Session
+        # (and its cookie jar) is not safe to share across threads
+        self._worker = threading.local()
+        self._worker_sessions = []
         self.results = []
+        # Results carry monotonic offsets from this anchor; wall-clock ISO strings
+        # are only built when the report is written
+        self.run_started_at = datetime.now()
+        self.run_started_monotonic = time.monotonic()
         self.report_file = f"diagnostics/comprehensive_page_test_report_{user_config['user_type'].lower()}_{user_config['username']}.md"
 
+    @staticmethod
+    def _new_session():
+        session = requests.Session()
+        # Every URL hits the same host: keep a warm connection pool and retry gateway blips
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                              raise_on_status=False),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _worker_session(self):
+        """This worker thread's Session, seeded with the authenticated cookies"""
+        session = getattr(self._worker, 'session', None)
+        if session is None:
+            session = self._worker.session = self._new_session()
+            session.cookies.update(self.session.cookies)
+            self._worker_sessions.append(session)
+        return session
+
+    @property
+    def cookie_path(self):
+        return f"diagnostics/session_{self.user_config['username']}.json"
+
+    def _load_session(self):
+        """Reuse the session cookie from a previous run if one was saved"""
+        if not os.path.exists(self.cookie_path):
+            return
+        try:
+            with open(self.cookie_path) as f:
+                self.session.cookies.update(requests.utils.cookiejar_from_dict(json.load(f)))
+        except (OSError, ValueError, TypeError):
+            self._forget_session()
+
+    def _save_session(self):
+        with open(self.cookie_path, 'w') as f:
+            json.dump(requests.utils.dict_from_cookiejar(self.session.cookies), f)
+
+    def _forget_session(self):
+        try:
+            os.remove(self.cookie_path)
+        except FileNotFoundError:
+            pass
+
+    def _session_still_valid(self):
+        """One cheap HEAD against this user's dashboard instead of a full login round-trip"""
+        if not self.session.cookies:
+            return False
+        dashboard = '/portal/council/' if self.user_config['user_type'] == 'Council' else '/portal/ricd/'
+        try:
+            response = self.session.head(urljoin(BASE_URL, dashboard), allow_redirects=False, timeout=5)
+        except requests.exceptions.RequestException:
+            return False
+        return response.status_code == 200
+
     def login(self):
         """Login to get authenticated session"""
         try:
@@ -86,11 +189,11 @@ class PageTester:
                 return False, f"Login page returned {response.status_code}"
 
             # Extract CSRF token
-            csrf_match = re.search(r'name="csrfmiddlewaretoken" value="([^"]+)"', response.text)
+            csrf_match = _CSRF_RE.search(response.content)
             if not csrf_match:
                 return False, "Could not find CSRF token"
 
-            csrf_token = csrf_match.group(1)
+            csrf_token = csrf_match.group(1).decode('ascii')
 
             # Login
             login_data = {
@@ -121,20 +224,44 @@ class PageTester:
 
     def test_url(self, url_path, description=""):
         """Test a single URL"""
+        result = self._fetch(url_path, description)
+        if result.get('bounced_to_login'):
+            self._forget_session()
+        self.results.append(result)
+        return result
+
+    def _fetch(self, url_path, description="", session=None):
+        """Request a single URL and build its result dict (does not record it)"""
         full_url = urljoin(BASE_URL, url_path)
 
         try:
-            response = self.session.get(full_url, timeout=30)
+            # Only the head of the body is needed: size, plus any traceback near the top
+            with _REQUEST_SLOTS:
+                response = (session or self.session).get(full_url, timeout=30, stream=True)
+                try:
+                    # One byte past the limit tells a capped read from a short page
+                    data = response.raw.read(BODY_READ_LIMIT + 1, decode_content=True)
+                finally:
+                    response.close()  # hand the connection back to the pool
+
+            truncated = len(data) > BODY_READ_LIMIT
+            data = data[:BODY_READ_LIMIT]
+            body = data.decode(response.encoding or 'utf-8', errors='replace')
 
             result = {
                 'url': url_path,
                 'full_url': full_url,
                 'status_code': response.status_code,
                 'description': description,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': time.monotonic() - self.run_started_monotonic,
                 'success': response.status_code == 200,
                 'error_details': None,
-                'response_size': len(response.text)
+                # Decoded body bytes actually read, capped at BODY_READ_LIMIT
+                'response_size': len(data),
+                'truncated': truncated,
+                # Bounced to the login page: the saved session has expired. Callers
+                # forget it, so the cookie file is only touched from the main thread.
+                'bounced_to_login': bool(response.history) and LOGIN_URL in response.url,
             }
 
             if response.status_code != 200:
@@ -147,20 +274,12 @@ class PageTester:
                     result['error_details'] += " - Internal server error"
 
                     # Try to extract error details from response
-                    if "Traceback" in response.text:
-                        # Extract first few lines of traceback
-                        lines = response.text.split('\n')
-                        traceback_start = None
-                        for i, line in enumerate(lines):
-                            if "Traceback" in line:
-                                traceback_start = i
-                                break
-
-                        if traceback_start is not None:
-                            traceback_lines = lines[traceback_start:traceback_start+10]
-                            result['error_details'] += f"\nTraceback: {' '.join(traceback_lines)}"
-
-            self.results.append(result)
+                    # Extract first few lines of traceback, slicing from the match only
+                    idx = body.find("Traceback")
+                    if idx != -1:
+                        traceback_lines = body[idx:idx + 4096].splitlines()[:10]
+                        result['error_details'] += f"\nTraceback: {' '.join(traceback_lines)}"
+
             return result
 
         except requests.exceptions.Timeout:
@@ -169,12 +288,12 @@ class PageTester:
                 'full_url': full_url,
                 'status_code': None,
                 'description': description,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': time.monotonic() - self.run_started_monotonic,
                 'success': False,
                 'error_details': "Request timeout",
-                'response_size': 0
+                'response_size': 0,
+                'truncated': False,
             }
-            self.results.append(result)
             return result
 
         except Exception as e:
@@ -183,38 +302,58 @@ class PageTester:
                 'full_url': full_url,
                 'status_code': None,
                 'description': description,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': time.monotonic() - self.run_started_monotonic,
                 'success': False,
                 'error_details': f"Error: {str(e)}",
-                'response_size': 0
+                'response_size': 0,
+                'truncated': False,
             }
-            self.results.append(result)
             return result
 
     def test_all_urls(self):
         """Test all URLs from portal/urls.py"""
-        print(f"Starting comprehensive page testing at {datetime.now()}")
+        _log(f"Starting comprehensive page testing at {datetime.now()}")
 
         # Test public URLs first
-        print("Testing public URLs...")
+        _log("Testing public URLs...")
         for url in PUBLIC_URLS:
             result = self.test_url(url, "Public page")
-            print(f"  {url}: {result['status_code']} - {'✓' if result['success'] else '✗'}")
-
-        # Try login
-        print("Attempting login...")
-        login_success, login_message = self.login()
-        print(f"  Login: {'✓' if login_success else '✗'} - {login_message}")
+            _log(f"  {url}: {result['status_code']} - {'✓' if result['success'] else '✗'}")
+
+        # Try login, unless the saved session is still good; it is only loaded
+        # now so the public pages above are fetched anonymously
+        self._load_session()
+        if self._session_still_valid():
+            login_success = True
+            _log("  Login: ✓ - reused saved session")
+        else:
+            _log("Attempting login...")
+            login_success, login_message = self.login()
+            _log(f"  Login: {'✓' if login_success else '✗'} - {login_message}")
+            if login_success:
+                self._save_session()
+            else:
+                self._forget_session()
 
         if login_success:
             # Test protected URLs
-            print("Testing protected URLs...")
-            for url in PROTECTED_URLS:
-                result = self.test_url(url, "Protected page")
-                print(f"  {url}: {result['status_code']} - {'✓' if result['success'] else '✗'}")
+            _log("Testing protected URLs...")
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                fetched = list(executor.map(
+                    lambda url: self._fetch(url, "Protected page", self._worker_session()),
+                    PROTECTED_URLS))
+            for session in self._worker_sessions:
+                session.close()
+            if any(result.get('bounced_to_login') for result in fetched):
+                self._forget_session()
+
+            # Recorded and printed in PROTECTED_URLS order, not completion order
+            for url, result in zip(PROTECTED_URLS, fetched):
+                self.results.append(result)
+                _log(f"  {url}: {result['status_code']} - {'✓' if result['success'] else '✗'}")
 
                 if not result['success'] and result['error_details']:
-                    print(f"    Error: {result['error_details'][:100]}...")
+                    _log(f"    Error: {result['error_details'][:100]}...")
 
         # Generate report
         self.generate_report()
@@ -226,8 +365,15 @@ class PageTester:
         total_tests = len(self.results)
         successful_tests = len([r for r in self.results if r['success']])
         failed_tests = total_tests - successful_tests
+        success_rate = successful_tests / total_tests * 100 if total_tests else 0.0
+        timestamps = [
+            (self.run_started_at + timedelta(seconds=r['timestamp'])).isoformat()
+            for r in self.results
+        ]
 
-        report = f"""# Comprehensive Django Application Testing Report
+        # Written fragment by fragment through a 64KB buffer; the report is never held whole
+        with open(self.report_file, 'w', buffering=1 << 16) as f:
+            f.write(f"""# Comprehensive Django Application Testing Report
 
 **Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 **Test Environment:** Django Development Server on {BASE_URL}
@@ -238,61 +384,70 @@ class PageTester:
 - **Total Tests:** {total_tests}
 - **Successful:** {successful_tests}
 - **Failed:** {failed_tests}
-- **Success Rate:** {successful_tests/total_tests*100:.1f}%
+- **Success Rate:** {success_rate:.1f}%
 
 ## Test Results
 
 | URL | Status | Error Details |
 |-----|--------|---------------|
-"""
-
-        for result in self.results:
-            status = "✓" if result['success'] else "✗"
-            error = result['error_details'] or ""
-            report += f"| `{result['url']}` | {status} ({result['status_code'] or 'ERR'}) | {error} |\n"
+""")
+
+            for result in self.results:
+                status = "✓" if result['success'] else "✗"
+                error = result['error_details'] or ""
+                f.write(f"| `{result['url']}` | {status} ({result['status_code'] or 'ERR'}) | {error} |\n")
+
+            f.write("\n## Detailed Results\n\n")
+
+            for result, timestamp in zip(self.results, timestamps):
+                f.write(f"### {result['url']}\n")
+                f.write(f"- **Full URL:** {result['full_url']}\n")
+                f.write(f"- **Status:** {'SUCCESS' if result['success'] else 'FAILED'}\n")
+                f.write(f"- **HTTP Code:** {result['status_code']}\n")
+                size_note = f" (read limit; page is larger than {BODY_READ_LIMIT // 1024}KB)" if result['truncated'] else ""
+                f.write(f"- **Response Size:** {result['response_size']} bytes{size_note}\n")
+                f.write(f"- **Timestamp:** {timestamp}\n")
+
+                if result['error_details']:
+                    f.write(f"- **Error Details:** {result['error_details']}\n")
+
+                f.write("\n")
+
+        # Machine-readable copy of the same results for CI / diffing
+        json_file = self.report_file[:-len('.md')] + '.json'
+        json_results = [dict(r, timestamp=ts) for r, ts in zip(self.results, timestamps)]
+        with open(json_file, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(json_results, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(json_results, indent=2, ensure_ascii=False).encode('utf-8'))
 
-        report += "\n## Detailed Results\n\n"
+        _log(f"\nReport generated: {self.report_file}")
+        _log(f"Summary: {successful_tests}/{total_tests} tests passed ({success_rate:.1f}%)")
 
-        for result in self.results:
-            report += f"### {result['url']}\n"
-            report += f"- **Full URL:** {result['full_url']}\n"
-            report += f"- **Status:** {'SUCCESS' if result['success'] else 'FAILED'}\n"
-            report += f"- **HTTP Code:** {result['status_code']}\n"
-            report += f"- **Response Size:** {result['response_size']} bytes\n"
-            report += f"- **Timestamp:** {result['timestamp']}\n"
 
-            if result['error_details']:
-                report += f"- **Error Details:** {result['error_details']}\n"
+def _run_one(user_config):
+    """Run the full sweep for one user and return its summary entry"""
+    _log(f"\n{'='*60}\nTesting user: {user_config['description']}\n{'='*60}")
 
-            report += "\n"
+    tester = PageTester(user_config)
+    tester.test_all_urls()
 
-        # Write report
-        with open(self.report_file, 'w') as f:
-            f.write(report)
+    # Collect results for summary
+    return {
+        'user': user_config,
+        'results': tester.results,
+        'success_count': len([r for r in tester.results if r['success']]),
+        'total_count': len(tester.results)
+    }
 
-        print(f"\nReport generated: {self.report_file}")
-        print(f"Summary: {successful_tests}/{total_tests} tests passed ({successful_tests/total_tests*100:.1f}%)")
 
 if __name__ == "__main__":
     print(f"Starting comprehensive page testing for all users at {datetime.now()}")
 
-    all_results = []
-
-    for user_config in TEST_USERS:
-        print(f"\n{'='*60}")
-        print(f"Testing user: {user_config['description']}")
-        print(f"{'='*60}")
-
-        tester = PageTester(user_config)
-        tester.test_all_urls()
-
-        # Collect results for summary
-        all_results.append({
-            'user': user_config,
-            'results': tester.results,
-            'success_count': len([r for r in tester.results if r['success']]),
-            'total_count': len(tester.results)
-        })
+    # Each tester owns its session and report file, so users can run side by side
+    with ThreadPoolExecutor(max_workers=len(TEST_USERS)) as executor:
+        all_results = list(executor.map(_run_one, TEST_USERS))
 
     # Generate overall summary
     print(f"\n{'='*80}")
@@ -15,8 +15,10 @@ Run this whenever changes are made to ensure NOTHING breaks!
 
 Usage:
 pytest test_comprehensive_regression.py -v
+pytest test_comprehensive_regression.py -v -n auto --dist loadscope   # parallel
 """
 
+import functools
 import pytest
 import os
 import sys
@@ -32,32 +34,96 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'testproj.settings')
 import django
 django.setup()
 
-from django.test import TestCase, Client
+from django.test import TestCase, RequestFactory, override_settings
 from django.contrib.auth.models import User
 from django.contrib.auth import get_user_model
-from django.urls import reverse, resolve
-from django.template.loader import get_template, TemplateDoesNotExist
+from django.urls import reverse, resolve, Resolver404
+from django.template.loader import get_template
 from ricd.models import *
 from portal.models import *
 from portal import forms
 
 
+@functools.lru_cache(maxsize=None)
+def _tpl(name):
+    """get_template() memoised for the life of the test run."""
+    return get_template(name)
+
+
+CRITICAL_TEMPLATES = (
+    'portal/base.html',
+    'portal/ricd_dashboard.html',
+    'portal/council_dashboard.html',
+    'portal/project_detail.html',
+    'portal/interim_frp_detail.html',  # The one we created; must exist
+    'portal/forward_rpf_detail.html',
+    'portal/remote_capital_program_detail.html',
+    'portal/council_form.html',
+    'portal/program_form.html',
+    'portal/work_form.html',
+    'portal/analytics_dashboard.html',
+)
+
+URL_PATTERNS = (
+    ('/', None),  # Root should resolve
+    ('/portal/ricd/', 'portal:ricd_dashboard'),
+    ('/portal/council/', 'portal:council_dashboard'),
+    ('/portal/projects/', 'portal:project_list'),
+    ('/portal/analytics/', 'portal:analytics_dashboard'),
+    ('/portal/help/ricd/', 'portal:help_ricd'),
+    ('/portal/portal/councils/create/', 'portal:council_create'),
+)
+
+LOGIN_REQUIRED_URL_NAMES = (
+    'portal:ricd_dashboard',
+    'portal:council_dashboard',
+    'portal:project_list',
+    'portal:analytics_dashboard',
+)
+
+ADMIN_URL_NAMES = (
+    'portal:ricd_dashboard',
+    'portal:analytics_dashboard',
+    'portal:council_list',
+    'portal:help_ricd',
+)
+
+DETAIL_URL_NAMES = (
+    'portal:project_detail',
+    'portal:council_detail',
+    'portal:program_detail',
+)
+
+# Render context per template, as context key -> test-case attribute name
+DEFAULT_CONTEXT = {'user': 'superuser'}
+CONTEXT_MAP = {
+    'portal/council_dashboard.html': {'user': 'council_user'},
+    'portal/project_detail.html': {'user': 'superuser', 'project': 'project'},
+    'portal/interim_frp_detail.html': {'user': 'superuser', 'agreement': 'interim_agreement'},
+    'portal/forward_rpf_detail.html': {'user': 'superuser', 'agreement': 'forward_agreement'},
+    'portal/remote_capital_program_detail.html': {'user': 'superuser', 'agreement': 'rcp_agreement'},
+}
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class ComprehensiveRegressionTestSuite(TestCase):
     """Comprehensive test suite covering all aspects of the Django application"""
 
     @classmethod
     def setUpTestData(cls):
-        # Create fixtures once for all tests
-        cls.council = Council.objects.create(
+        # Create fixtures once for all tests. The rows nothing else depends on
+        # at insert time go through bulk_create, which skips save() and the
+        # pre/post-save signal dispatch; the backend returns their pks.
+        cls.council, = Council.objects.bulk_create([Council(
             name='Test Council',
             abn='12345678901',
             default_suburb='Test Suburb'
-        )
+        )])
 
-        cls.program = Program.objects.create(
+        cls.program, = Program.objects.bulk_create([Program(
             name='Test Program',
             description='Test program for comprehensive testing'
-        )
+        )])
 
         cls.project = Project.objects.create(
             council=cls.council,
@@ -72,15 +138,15 @@ class ComprehensiveRegressionTestSuite(TestCase):
             postcode='4000'
         )
 
-        cls.work_type = WorkType.objects.create(
+        cls.work_type, = WorkType.objects.bulk_create([WorkType(
             code='test_wt',
             name='Test Work Type'
-        )
+        )])
 
-        cls.output_type = OutputType.objects.create(
+        cls.output_type, = OutputType.objects.bulk_create([OutputType(
             code='test_ot',
             name='Test Output Type'
-        )
+        )])
 
         # Create work for testing
         cls.work = Work.objects.create(
@@ -90,25 +156,37 @@ class ComprehensiveRegressionTestSuite(TestCase):
             estimated_cost=10000
         )
 
-    def setUp(self):
-        """Set up test client and users"""
-        self.client = Client()
-
-        # Create test users
-        self.superuser = User.objects.create_superuser(
+        # Create test users once; each test's transaction rollback keeps them clean
+        cls.superuser = User.objects.create_superuser(
             username='admin',
             email='admin@test.com',
             password='admin123'
         )
 
-        self.council_user = User.objects.create_user(
+        cls.council_user = User.objects.create_user(
             username='council_test',
             email='council@test.com',
             password='council123'
         )
 
         # Create user profile
-        UserProfile.objects.create(user=self.council_user, council=self.council)
+        cls.user_profile = UserProfile.objects.create(user=cls.council_user, council=cls.council)
+
+        # Funding agreements for the detail templates and views
+        cls.interim_agreement = InterimForwardProgramFundingAgreement.objects.create(
+            council=cls.council,
+            date_executed='2024-01-01'
+        )
+
+        cls.forward_agreement = ForwardRemoteProgramFundingAgreement.objects.create(
+            council=cls.council,
+            date_executed='2024-01-01'
+        )
+
+        cls.rcp_agreement = RemoteCapitalProgramFundingAgreement.objects.create(
+            council=cls.council,
+            date_executed='2024-01-01'
+        )
 
     # ============================
     # VIEW FUNCTIONALITY TESTS
@@ -163,10 +241,7 @@ class ComprehensiveRegressionTestSuite(TestCase):
 
         self.client.login(username='admin', password='admin123')
 
-        # Create a test InterimForwardProgramFundingAgreement
-        ifrfp_agreement = InterimForwardProgramFundingAgreement.objects.create(council=self.council)
-
-        response = self.client.get(reverse('portal:interim_frp_detail', kwargs={'pk': ifrfp_agreement.pk}))
+        response = self.client.get(reverse('portal:interim_frp_detail', kwargs={'pk': self.interim_agreement.pk}))
         # Should not 500 error or TemplateDoesNotExist
         self.assertIn(response.status_code, [200, 302])  # OK or redirect
 
@@ -177,71 +252,24 @@ class ComprehensiveRegressionTestSuite(TestCase):
     def test_all_critical_templates_exist_and_render(self):
         """Test that all critical templates exist and can render"""
 
-        critical_templates = [
-            'portal/base.html',
-            'portal/ricd_dashboard.html',
-            'portal/council_dashboard.html',
-            'portal/project_detail.html',
-            'portal/interim_frp_detail.html',  # The one we created
-            'portal/forward_rpf_detail.html',
-            'portal/remote_capital_program_detail.html',
-            'portal/council_form.html',
-            'portal/program_form.html',
-            'portal/work_form.html',
-            'portal/analytics_dashboard.html',
-        ]
-
-        # Create necessary fixtures for template context
-        if not hasattr(self, 'interim_agreement'):
-            self.interim_agreement = InterimForwardProgramFundingAgreement.objects.create(
-                council=self.council,
-                date_executed='2024-01-01'
-            )
-
-        if not hasattr(self, 'forward_agreement'):
-            self.forward_agreement = ForwardRemoteProgramFundingAgreement.objects.create(
-                council=self.council,
-                date_executed='2024-01-01'
-            )
-
-        if not hasattr(self, 'rcp_agreement'):
-            self.rcp_agreement = RemoteCapitalProgramFundingAgreement.objects.create(
-                council=self.council,
-                date_executed='2024-01-01'
-            )
-
-        context_map = {
-            'portal/base.html': {'user': self.superuser},
-            'portal/ricd_dashboard.html': {'user': self.superuser},
-            'portal/council_dashboard.html': {'user': self.council_user},
-            'portal/project_detail.html': {'user': self.superuser, 'project': self.project},
-            'portal/interim_frp_detail.html': {'user': self.superuser, 'agreement': self.interim_agreement},
-            'portal/forward_rpf_detail.html': {'user': self.superuser, 'agreement': self.forward_agreement},
-            'portal/remote_capital_program_detail.html': {'user': self.superuser, 'agreement': self.rcp_agreement},
-            'portal/council_form.html': {'user': self.superuser},
-            'portal/program_form.html': {'user': self.superuser},
-            'portal/work_form.html': {'user': self.superuser},
-            'portal/analytics_dashboard.html': {'user': self.superuser},
-        }
-
-        for template_name in critical_templates:
+        for template_name in CRITICAL_TEMPLATES:
             with self.subTest(template=template_name):
-                try:
-                    template = get_template(template_name)
-                    # Use proper context for this template
-                    context = context_map.get(template_name, {'user': self.superuser})
-                    from django.template import RequestContext
-                    rendered = template.render(context)
-                    self.assertIsInstance(rendered, str, f"Template {template_name} should render to string")
-                    self.assertGreater(len(rendered.strip()), 10, f"Template {template_name} should have meaningful content")
-                except Exception as e:
-                    print(f"Template {template_name} failed with context {context}: {e}")
-                    # Note: Templates with URL generation may fail in test context
+                template = _tpl(template_name)
+                # Use proper context for this template
+                context = {key: getattr(self, attr) for key, attr in
+                           CONTEXT_MAP.get(template_name, DEFAULT_CONTEXT).items()}
+                # A real request lets {% csrf_token %} and the context
+                # processors run, as they would in a view
+                request = RequestFactory().get('/')
+                request.user = context['user']
+                rendered = template.render(context, request=request)
+                self.assertIsInstance(rendered, str, f"Template {template_name} should render to string")
+                self.assertGreater(len(rendered.strip()), 10, f"Template {template_name} should have meaningful content")
 
     def test_base_template_contains_essential_elements(self):
         """Test that base template contains essential HTML structure"""
 
-        template = get_template('portal/base.html')
+        template = _tpl('portal/base.html')
         rendered = template.render({})
 
         # Check for essential elements
@@ -261,7 +289,7 @@ class ComprehensiveRegressionTestSuite(TestCase):
         self.assertEqual(self.work.project, self.project)
 
         # Test reverse relationships
-        self.assertIn(self.work, self.address.works.all())
+        self.assertTrue(self.address.works.filter(pk=self.work.pk).exists())
         self.assertIn(self.work, self.project.works())
 
         # Test Work has no direct project field (our fix confirmed this)
@@ -283,7 +311,7 @@ class ComprehensiveRegressionTestSuite(TestCase):
         self.assertEqual(quarterly_report.work, self.work)
 
         # Test reverse relationship
-        self.assertIn(quarterly_report, self.work.quarterly_reports.all())
+        self.assertTrue(self.work.quarterly_reports.filter(pk=quarterly_report.pk).exists())
 
     # ============================
     # FORM VALIDATION TESTS
@@ -334,90 +362,10 @@ class ComprehensiveRegressionTestSuite(TestCase):
             council_choices = list(form.fields['council'].queryset)
             self.assertIn(self.council, council_choices)
 
-    # ============================
-    # URL PATTERNS AND ROUTING TESTS
-    # ============================
-
-    def test_url_patterns_resolve_correctly(self):
-        """Test that all URL patterns resolve to the correct views"""
-
-        test_patterns = [
-            ('/', None),  # Root should resolve
-            ('/portal/ricd/', 'portal:ricd_dashboard'),
-            ('/portal/council/', 'portal:council_dashboard'),
-            ('/portal/projects/', 'portal:project_list'),
-            ('/portal/analytics/', 'portal:analytics_dashboard'),
-            ('/portal/help/ricd/', 'portal:help_ricd'),
-            ('/portal/portal/councils/create/', 'portal:council_create'),
-        ]
-
-        for url, expected_name in test_patterns:
-            with self.subTest(url=url):
-                try:
-                    resolved = resolve(url)
-                    if expected_name:
-                        self.assertEqual(resolved.url_name, expected_name.split(':')[1])
-                except Exception as e:
-                    # Some URLs might not exist, that's ok as long as it doesn't crash
-                    pass
-
-    # ============================
-    # AUTHENTICATION AND AUTHORIZATION TESTS
-    # ============================
-
-    def test_login_required_views_redirect_unauthenticated(self):
-        """Test that login-required views redirect unauthenticated users"""
-
-        login_required_urls = [
-            reverse('portal:ricd_dashboard'),
-            reverse('portal:council_dashboard'),
-            reverse('portal:project_list'),
-            reverse('portal:analytics_dashboard'),
-        ]
-
-        for url in login_required_urls:
-            with self.subTest(url=url):
-                response = self.client.get(url)
-                self.assertEqual(response.status_code, 302, f"URL {url} should redirect unauthenticated user")
-
-    def test_authenticated_users_can_access_views(self):
-        """Test that authenticated users can access their allowed views"""
-
-        self.client.login(username='admin', password='admin123')
-
-        admin_urls = [
-            reverse('portal:ricd_dashboard'),
-            reverse('portal:analytics_dashboard'),
-            reverse('portal:council_list'),
-            reverse('portal:help_ricd'),
-        ]
-
-        for url in admin_urls:
-            with self.subTest(url=url):
-                response = self.client.get(url)
-                self.assertIn(response.status_code, [200, 302], f"Admin should access {url}")
-
     # ============================
     # EDGE CASE AND ERROR HANDLING TESTS
     # ============================
 
-    def test_invalid_object_ids_return_404(self):
-        """Test invalid object IDs return 404 not 500"""
-
-        self.client.login(username='admin', password='admin123')
-
-        invalid_urls = [
-            reverse('portal:project_detail', kwargs={'pk': 99999}),
-            reverse('portal:council_detail', kwargs={'pk': 99999}),
-            reverse('portal:program_detail', kwargs={'pk': 99999}),
-        ]
-
-        for url in invalid_urls:
-            with self.subTest(url=url):
-                response = self.client.get(url)
-                # Should be 404, not 500
-                self.assertIn(response.status_code, [404, 302])
-
     def test_template_inheritance_works(self):
         """Test that template inheritance works correctly"""
 
@@ -430,7 +378,7 @@ class ComprehensiveRegressionTestSuite(TestCase):
 
         for template_name in templates_with_base:
             with self.subTest(template=template_name):
-                template = get_template(template_name)
+                template = _tpl(template_name)
                 rendered = template.render({'user': self.superuser})
 
                 # Should include base template content
@@ -454,45 +402,69 @@ class ComprehensiveRegressionTestSuite(TestCase):
 
 
 # ============================
-# PYTEST TESTS
+# URL PATTERNS AND ROUTING TESTS
 # ============================
+# URL resolution is pure URLconf dispatch: no database, so no django_db mark
+# and none of TestCase's per-test transaction setup.
 
-def test_django_settings_loaded():
-    """Ensure Django settings are loaded correctly"""
-    from django.conf import settings
-    assert hasattr(settings, 'DEBUG')
-    assert hasattr(settings, 'SECRET_KEY')
+@pytest.mark.parametrize('url, expected_name', URL_PATTERNS)
+def test_url_patterns_resolve_correctly(url, expected_name):
+    """Test that all URL patterns resolve to the correct views"""
+    try:
+        resolved = resolve(url)
+    except Resolver404:
+        # Some URLs might not exist, that's ok as long as it doesn't crash
+        return
+    if expected_name:
+        assert resolved.url_name == expected_name.split(':')[1]
 
 
-def test_database_schemas_valid():
-    """Test that models can be instantiated and basic relationships work"""
-    # This is just a smoke test that the models are set up correctly
-    from ricd.models import Council, Project
-    assert Council
-    assert Project
+# ============================
+# AUTHENTICATION AND AUTHORIZATION TESTS
+# ============================
+# One parametrized case per URL, so each is reported (and can be distributed
+# by xdist) on its own instead of stopping at the first failure in a loop.
 
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name', LOGIN_REQUIRED_URL_NAMES)
+def test_login_required_views_redirect_unauthenticated(client, url_name):
+    """Test that login-required views redirect unauthenticated users"""
+    url = reverse(url_name)
+    response = client.get(url)
+    assert response.status_code == 302, f"URL {url} should redirect unauthenticated user"
 
-def test_our_specific_fixes_work():
-    """Test the specific issues we fixed during the systematic review"""
 
-    # Import required fixtures
-    import os
-    import django
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name', ADMIN_URL_NAMES)
+def test_authenticated_users_can_access_views(admin_client, url_name):
+    """Test that authenticated users can access their allowed views"""
+    url = reverse(url_name)
+    response = admin_client.get(url)
+    assert response.status_code in (200, 302), f"Admin should access {url}"
 
-    # Make sure we can import the models we fixed
-    from ricd.models import InterimForwardProgramFundingAgreement
-    from portal.models import AnalyticsDashboardView
 
-    # Test that InterimForwardProgramFundingAgreement exists
-    assert InterimForwardProgramFundingAgreement
+# ============================
+# EDGE CASE AND ERROR HANDLING TESTS
+# ============================
 
-    # Test that our fixed template exists
-    from django.template.loader import get_template
-    try:
-        template = get_template('portal/interim_frp_detail.html')
-        assert template
-    except TemplateDoesNotExist:
-        pytest.fail("interim_frp_detail.html template does not exist!")
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name', DETAIL_URL_NAMES)
+def test_invalid_object_ids_return_404(admin_client, url_name):
+    """Test invalid object IDs return 404 not 500"""
+    response = admin_client.get(reverse(url_name, kwargs={'pk': 99999}))
+    # Should be 404, not 500
+    assert response.status_code in (404, 302)
+
+
+# ============================
+# PYTEST TESTS
+# ============================
+
+def test_django_settings_loaded():
+    """Ensure Django settings are loaded correctly"""
+    from django.conf import settings
+    assert hasattr(settings, 'DEBUG')
+    assert hasattr(settings, 'SECRET_KEY')
 
 
 if __name__ == '__main__':
@@ -507,4 +479,7 @@ if __name__ == '__main__':
     print("- Specific bug fixes")
     print("="*50)
 
-    pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
+    # One worker per CPU; loadscope keeps each TestCase on a single worker so
+    # setUpTestData still runs once per class. pytest-django gives every
+    # worker its own test database (test_<name>_gw0, _gw1, ...).
+    pytest.main([__file__, "-v", "-n", "auto", "--dist", "loadscope"])
\ No newline at end of file
@@ -17,29 +17,184 @@ python test_dynamic_comprehensive.py --run-all
 
 import os
 import sys
+import argparse
+import ast
+import functools
+import re
+import threading
 import django
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urljoin
+from django.apps import apps
 from django.test import TestCase, Client
 from django.contrib.auth.models import User
-from django.urls import reverse
-from django.template.loader import get_template, TemplateDoesNotExist
+from django.urls import get_resolver, reverse
+from django.template import engines
+from django.template.context import Context, RenderContext
+from django.template.loader import TemplateDoesNotExist
 from django.conf import settings
 from django.core.management import execute_from_command_line
 
 # Disable django debug logging
 logging.getLogger('django').setLevel(logging.WARNING)
 
+# Compiled once; used per 500 response and per views.py scan
+_TEMPLATE_ERR_RE = re.compile(r'TemplateDoesNotExist.*?(portal/[\w\-\.]+)')
+_TEMPLATE_NAME_RE = re.compile(r'template_name\s*=\s*["\']([^"\']+)["\']')
+_RENDER_RE = re.compile(r'render\([^,)]+,\s*["\']([^"\']+)["\']')
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_reverse(name):
+    """reverse() memoised on the URL name; the URLconf is fixed for the run"""
+    return reverse(name)
+
+
+# Template name -> compiled template, or None once the loaders have said it
+# does not exist; discovery heuristics propose the same names repeatedly
+_TEMPLATE_LOOKUPS = {}
+
+
+def _lookup_template(name):
+    """Resolve a template through the Django engine once per name, negatives included"""
+    try:
+        return _TEMPLATE_LOOKUPS[name]
+    except KeyError:
+        pass
+    try:
+        template = engines['django'].get_template(name)
+    except TemplateDoesNotExist:
+        template = None
+    _TEMPLATE_LOOKUPS[name] = template
+    return template
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_views(path, mtime_ns):
+    """Template names a views module names via *template_name = "..." or render(request, "...").
+
+    Cached on (path, mtime) so repeated scans in one run parse the file once.
+    Falls back to the regexes if the file does not parse.
+    """
+    source = Path(path).read_bytes()
+    try:
+        tree = ast.parse(source, filename=path)
+    except SyntaxError:
+        text = source.decode('utf-8', 'replace')
+        return frozenset(_TEMPLATE_NAME_RE.findall(text)) | frozenset(_RENDER_RE.findall(text))
+
+    def _str(node):
+        return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            # *template_name, like the regex: also catches popup_template_name etc.
+            if any((getattr(t, 'id', None) or getattr(t, 'attr', '')).endswith('template_name')
+                   for t in targets):
+                name = _str(node.value) if node.value is not None else None
+                if name:
+                    found.add(name)
+        elif isinstance(node, ast.Call) and len(node.args) >= 2:
+            func = node.func
+            if getattr(func, 'id', getattr(func, 'attr', None)) == 'render':
+                name = _str(node.args[1])
+                if name:
+                    found.add(name)
+    return frozenset(found)
+
+
+# URL checks are I/O-bound round-trips to the dev server; run this many at once
+URL_TEST_WORKERS = 32
+URL_PROGRESS_EVERY = 50
+TEMPLATE_TEST_WORKERS = 8
+
+# Per-thread render Context for _check_template
+_render_state = threading.local()
+
+def _extract_template_error(response_text):
+    """Extract template name from TemplateDoesNotExist error"""
+    match = _TEMPLATE_ERR_RE.search(response_text)
+    if match:
+        return match.group(1)
+    return "Unknown template"
+
+
+# Response analysis for test_single_url, one small handler per status class;
+# each fills in the mutable result dict from the response. Only the 200 and 5xx
+# handlers read the body; redirects and 404s are judged on status and headers.
+
+def _handle_200(result, response):
+    result['status'] = 'working'
+    # Check for form CSRF protection (bytes scan; no charset detection/decode)
+    result['csrf_protected'] = b'csrfmiddlewaretoken' in response.content
+
+
+def _handle_302(result, response):
+    # Redirect - check if it's to login (unauthorized)
+    location = response.headers.get('location', '')
+    if 'login' in location.lower() or location.startswith('/admin/login'):
+        result['status'] = 'requires_auth'
+    else:
+        result['status'] = 'redirect'
+        result['error'] = f"Redirect to: {location}"
+
+
+def _handle_404(result, response):
+    result['status'] = 'not_found'
+    result['error'] = "404 Not Found"
+
+
+def _handle_5xx(result, response):
+    # Server error - likely our TemplateDoesNotExist or other template error
+    result['status'] = 'server_error'
+    result['error'] = f"500+ Server Error: {response.status_code}"
+    try:
+        # Try to extract error details; only decode once the marker is there
+        if b'TemplateDoesNotExist' in response.content:
+            result['error'] = f"TemplateDoesNotExist: {_extract_template_error(response.text)}"
+    except Exception:
+        pass
+
+
+def _handle_other(result, response):
+    result['status'] = 'other'
+    result['error'] = f"Unexpected status: {response.status_code}"
+
+
+_STATUS_HANDLERS = {200: _handle_200, 302: _handle_302, 404: _handle_404}
+
+
 class DynamicDjangoTester:
     """Dynamic tester that discovers and tests all Django components"""
 
-    def __init__(self):
+    def __init__(self, in_process=False, verbose=False):
+        # in_process: drive views through django.test.Client instead of HTTP to
+        # the dev server; no sockets, but skips the server stack (WSGI, static)
+        self.in_process = in_process
+        self.verbose = verbose
+        self._discovered_urls = None
+        self.tclient = None
         self.project_path = Path(__file__).parent / 'testproj'
         self.base_url = "http://127.0.0.1:8080"  # Assumes Django dev server is running
         self.session = requests.Session()
+        # Every request hits the same dev server: size the keep-alive pool to the
+        # URL worker count so no thread waits on (or re-opens) a socket
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=URL_TEST_WORKERS,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504),
+                              raise_on_status=False),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.results = {
             'urls': {'total': 0, 'tested': 0, 'working': 0, 'broken': 0, 'details': []},
             'templates': {'total': 0, 'tested': 0, 'working': 0, 'broken': 0, 'details': []},
@@ -50,15 +205,18 @@ class DynamicDjangoTester:
 
     def setup_django(self):
         """Setup Django environment"""
+        if apps.ready:
+            # Registry and default connection are already up; nothing to redo
+            return
+
         sys.path.insert(0, str(self.project_path))
         os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'testproj.settings')
         django.setup()
 
-        # Import models after setup
-        global Project, Council, Work
+        # Import the app modules after setup so a broken app fails fast here
         try:
-            from ricd.models import *
-            from portal.models import *
+            import ricd.models
+            import portal.models
             from portal import forms, views
         except Exception as e:
             print(f"❌ Django setup failed: {e}")
@@ -68,6 +226,18 @@ class DynamicDjangoTester:
 
     def authenticate_session(self):
         """Login to Django app for authenticated testing"""
+        if self.in_process:
+            # Build the client here, after setup_django(); 500s come back as
+            # responses so they are reported like the HTTP path reports them
+            self.tclient = Client(raise_request_exception=False)
+            try:
+                self.tclient.force_login(User.objects.get(username='admin'))
+                print("✅ Authentication successful (in-process)")
+                return True
+            except User.DoesNotExist:
+                print("⚠️  Authentication failed: no 'admin' user")
+                return False
+
         try:
             login_data = {
                 'username': 'admin',
@@ -96,52 +266,66 @@ class DynamicDjangoTester:
             return "dummy_csrf_token"
 
     def discover_all_urls(self):
-        """Automatically discover all URLs in the Django application"""
-        from django.urls import get_resolver
-        from django.http import HttpRequest
+        """Automatically discover all URLs in the Django application
+
+        The URLconf does not change during a run, so the walk happens once and
+        later calls return the same list.
+        """
+        if self._discovered_urls is not None:
+            return self._discovered_urls
 
         print("\n🔍 DISCOVERING ALL URLS...")
 
         resolver = get_resolver()
         discovered_urls = []
 
-        def extract_patterns(patterns, prefix='', namespace=''):
-            """Recursively extract URL patterns"""
+        def extract_patterns(patterns, seen, namespace=''):
+            """Walk the URL tree with an explicit stack, keeping the first route per name"""
             results = []
-            for pattern in patterns:
+            # Children are pushed reversed so patterns come out in URLconf order
+            stack = [(pattern, namespace) for pattern in reversed(patterns)]
+            while stack:
+                pattern, namespace = stack.pop()
                 try:
-                    if hasattr(pattern, 'pattern') and hasattr(pattern, 'callback'):
+                    callback = getattr(pattern, 'callback', None)
+                    if callback is not None:
                         # This is a URL pattern
                         url_name = pattern.name
-                        if namespace and url_name:
+                        # Unnamed routes cannot be reversed; later routes that
+                        # reuse a name are skipped before paying for reverse()
+                        if not url_name:
+                            continue
+                        if namespace:
                             url_name = f"{namespace}:{url_name}"
+                        if url_name in seen:
+                            continue
+                        seen.add(url_name)
 
                         # Try to reverse the URL to see if it exists
                         try:
-                            if url_name:
-                                reverse(url_name)
-                                results.append({
-                                    'name': url_name,
-                                    'pattern': str(pattern.pattern),
-                                    'callback': pattern.callback,
-                                    'namespace': namespace
-                                })
+                            results.append({
+                                'name': url_name,
+                                'url': _cached_reverse(url_name),
+                                'pattern': str(pattern.pattern),
+                                'callback': callback,
+                                'namespace': namespace
+                            })
                         except Exception as e:
                             # URL might need parameters, add to results anyway
                             results.append({
-                                'name': url_name or str(pattern.pattern),
+                                'name': url_name,
                                 'pattern': str(pattern.pattern),
-                                'callback': pattern.callback,
+                                'callback': callback,
                                 'namespace': namespace,
                                 'error': str(e)
                             })
 
-                    elif hasattr(pattern, 'url_patterns'):
-                        # This is an include, recurse
-                        new_prefix = pattern.pattern if hasattr(pattern, 'pattern') else prefix
-                        new_namespace = getattr(pattern, 'namespace', namespace) or namespace
-                        nested = extract_patterns(pattern.url_patterns, new_prefix, new_namespace)
-                        results.extend(nested)
+                    else:
+                        children = getattr(pattern, 'url_patterns', None)
+                        if children is not None:
+                            # This is an include, descend
+                            child_namespace = getattr(pattern, 'namespace', namespace) or namespace
+                            stack.extend((child, child_namespace) for child in reversed(children))
 
                 except Exception as e:
                     print(f"⚠️  Error processing pattern: {e}")
@@ -149,19 +333,11 @@ class DynamicDjangoTester:
 
             return results
 
-        all_patterns = extract_patterns(resolver.url_patterns)
-        unique_urls = []
-
-        # Remove duplicates and invalid URLs
-        seen = set()
-        for url in all_patterns:
-            key = url.get('name', url.get('pattern', ''))
-            if key and key not in seen:
-                unique_urls.append(url)
-                seen.add(key)
+        unique_urls = extract_patterns(resolver.url_patterns, set())
 
         self.results['urls']['total'] = len(unique_urls)
         print(f"✅ Discovered {len(unique_urls)} unique URL patterns")
+        self._discovered_urls = unique_urls
         return unique_urls
 
     def test_single_url(self, url_info, test_mode='basic'):
@@ -179,55 +355,34 @@ class DynamicDjangoTester:
             'csrf_protected': None
         }
 
-        # Try to get the URL from reverse
+        # Discovery already reversed most names; fall back to the cache for the rest
         try:
-            url = reverse(url_name)
+            url = url_info.get('url') or _cached_reverse(url_name)
         except Exception as e:
             result['error'] = f"URL reverse failed: {e}"
             result['status'] = 'cannot_reverse'
             return result
 
-        # Test the URL with HTTP request
+        # Test the URL with HTTP request (or in-process; both responses expose
+        # status_code, text and headers)
         try:
-            response = self.session.get(f"{self.base_url}{url}", allow_redirects=False)
-
-            result['response_code'] = response.status_code
-
-            # Analyze response
-            if response.status_code == 200:
-                result['status'] = 'working'
-                # Check for form CSRF protection
-                if 'csrfmiddlewaretoken' in response.text:
-                    result['csrf_protected'] = True
-                else:
-                    result['csrf_protected'] = False
+            if self.tclient is not None:
+                response = self.tclient.get(url, follow=False)
+            else:
+                # stream=True: the body is only downloaded if a handler reads it
+                response = self.session.get(f"{self.base_url}{url}", allow_redirects=False,
+                                            stream=True)
 
-            elif response.status_code == 302:
-                # Redirect - check if it's to login (unauthorized)
-                location = response.headers.get('location', '')
-                if 'login' in location.lower() or location.startswith('/admin/login'):
-                    result['status'] = 'requires_auth'
-                else:
-                    result['status'] = 'redirect'
-                    result['error'] = f"Redirect to: {location}"
+            try:
+                result['response_code'] = response.status_code
 
-            elif response.status_code == 404:
-                result['status'] = 'not_found'
-                result['error'] = "404 Not Found"
-
-            elif response.status_code >= 500:
-                # Server error - likely our TemplateDoesNotExist or other template error
-                result['status'] = 'server_error'
-                result['error'] = f"500+ Server Error: {response.status_code}"
-                try:
-                    # Try to extract error details
-                    if 'TemplateDoesNotExist' in response.text:
-                        result['error'] = f"TemplateDoesNotExist: {self.extract_template_error(response.text)}"
-                except:
-                    pass
-            else:
-                result['status'] = 'other'
-                result['error'] = f"Unexpected status: {response.status_code}"
+                # Analyze response
+                code = response.status_code
+                handler = _STATUS_HANDLERS.get(code) or (_handle_5xx if code >= 500 else _handle_other)
+                handler(result, response)
+            finally:
+                # Hand the connection back to the pool, unread body or not
+                response.close()
 
         except requests.exceptions.RequestException as e:
             result['status'] = 'connection_error'
@@ -237,37 +392,44 @@ class DynamicDjangoTester:
 
     def extract_template_error(self, response_text):
         """Extract template name from TemplateDoesNotExist error"""
-        import re
-        match = re.search(r'TemplateDoesNotExist.*?(portal/[\w\-\.]+)', response_text)
-        if match:
-            return match.group(1)
-        return "Unknown template"
+        return _extract_template_error(response_text)
 
-    def test_all_urls(self):
-        """Test all discovered URLs"""
-        print(f"\n🧪 TESTING ALL {self.results['urls']['total']} URLS...")
+    def test_all_urls(self, urls=None):
+        """Test all discovered URLs (or the given url_info list)"""
+        urls_to_test = urls if urls is not None else self.discover_all_urls()
+        print(f"\n🧪 TESTING ALL {len(urls_to_test)} URLS...")
 
-        urls_to_test = self.discover_all_urls()
         tested_count = 0
         working_count = 0
 
-        for i, url_info in enumerate(urls_to_test, 1):
-            print(f"Testing URL {i}/{len(urls_to_test)}: {url_info.get('name', 'unnamed')}")
-
-            result = self.test_single_url(url_info)
-            tested_count += 1
-
-            if result['status'] == 'working':
-                working_count += 1
-            elif result['status'] in ['server_error', 'cannot_reverse']:
-                self.results['errors'].append({
-                    'type': 'url_error',
-                    'url': result['name'],
-                    'error': result['error'],
-                    'severity': 'high' if 'TemplateDoesNotExist' in str(result.get('error', '')) else 'medium'
-                })
-
-            self.results['urls']['details'].append(result)
+        # Fan the requests out over a thread pool; map() hands results back in
+        # discovery order so the log and report stay deterministic. In-process
+        # there is no network wait to overlap and the test client's cookie jar
+        # is shared, so run one at a time.
+        workers = 1 if self.tclient is not None else URL_TEST_WORKERS
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.test_single_url, urls_to_test)
+
+            for i, (url_info, result) in enumerate(zip(urls_to_test, results), 1):
+                # One line per URL only with --verbose; otherwise a progress line
+                # every URL_PROGRESS_EVERY URLs keeps the terminal out of the loop
+                if self.verbose:
+                    print(f"Tested URL {i}/{len(urls_to_test)}: {url_info.get('name', 'unnamed')}")
+                elif i % URL_PROGRESS_EVERY == 0 or i == len(urls_to_test):
+                    print(f"Tested {i}/{len(urls_to_test)} URLs")
+                tested_count += 1
+
+                if result['status'] == 'working':
+                    working_count += 1
+                elif result['status'] in ['server_error', 'cannot_reverse']:
+                    self.results['errors'].append({
+                        'type': 'url_error',
+                        'url': result['name'],
+                        'error': result['error'],
+                        'severity': 'high' if 'TemplateDoesNotExist' in str(result.get('error', '')) else 'medium'
+                    })
+
+                self.results['urls']['details'].append(result)
 
         self.results['urls']['tested'] = tested_count
         self.results['urls']['working'] = working_count
@@ -279,20 +441,24 @@ class DynamicDjangoTester:
         """Discover all templates referenced in views and test them"""
         print("\n🎨 DISCOVERING AND TESTING ALL TEMPLATES...")
 
-        from django.urls import get_resolver
-        from django.template.loader import get_template
-
         resolver = get_resolver()
         templates_found = set()
 
         def scan_patterns_for_templates(patterns):
-            """Recursively scan URL patterns for template names"""
-            for pattern in patterns:
-                if hasattr(pattern, 'callback'):
+            """Scan URL patterns for template names, walking includes with a stack"""
+            scanned_views = set()
+            stack = list(patterns)
+            while stack:
+                pattern = stack.pop()
+                view_func = getattr(pattern, 'callback', None)
+                if view_func is not None:
+                    # Several routes can share one view; inspect each only once
+                    if id(view_func) in scanned_views:
+                        continue
+                    scanned_views.add(id(view_func))
+
                     # Check if this is a class-based view or function view
                     try:
-                        view_func = pattern.callback
-
                         # For class-based views, try to get template_name
                         if hasattr(view_func, 'as_view'):
                             view_instance = view_func.as_view()()
@@ -302,8 +468,8 @@ class DynamicDjangoTester:
                                     templates_found.add(template_name)
 
                         # For function views, check for template name hints
-                        if hasattr(view_func, 'func_name'):
-                            func_name = view_func.func_name
+                        func_name = getattr(view_func, 'func_name', None)
+                        if func_name is not None:
                             # Common patterns: function_name.html or ModelName_list.html etc.
                             potential_templates = [
                                 f"portal/{func_name}.html",
@@ -315,52 +481,28 @@ class DynamicDjangoTester:
                     except Exception as e:
                         continue
 
-                elif hasattr(pattern, 'url_patterns'):
-                    # Recurse into included patterns
-                    scan_patterns_for_templates(pattern.url_patterns)
+                else:
+                    # Descend into included patterns
+                    stack.extend(getattr(pattern, 'url_patterns', ()))
 
         scan_patterns_for_templates(resolver.url_patterns)
 
         # Also scan views.py files for template references
         self.scan_views_for_template_references(str(self.project_path / 'testproj' / 'portal' / 'views.py'), templates_found)
 
-        tested_count = 0
-        working_count = 0
-
-        for template_name in sorted(templates_found):
-            tested_count += 1
-
-            result = {
-                'name': template_name,
-                'status': 'untested',
-                'error': None
-            }
+        # Loading hits the filesystem (stat/open release the GIL), so check
+        # templates on a small pool; results are recorded here, in name order,
+        # never from the worker threads
+        with ThreadPoolExecutor(max_workers=TEMPLATE_TEST_WORKERS) as executor:
+            checked = list(executor.map(self._check_template, sorted(templates_found)))
 
-            try:
-                template = get_template(template_name)
-                # Try to render with minimal context
-                rendered = template.render({})
-                result['status'] = 'working'
+        tested_count = len(checked)
+        working_count = 0
+        for result, error in checked:
+            if result['status'] == 'working':
                 working_count += 1
-            except TemplateDoesNotExist:
-                result['status'] = 'missing'
-                result['error'] = 'TemplateDoesNotExist'
-                self.results['errors'].append({
-                    'type': 'missing_template',
-                    'template': template_name,
-                    'error': 'TemplateDoesNotExist',
-                    'severity': 'high'
-                })
-            except Exception as e:
-                result['status'] = 'error'
-                result['error'] = str(e)
-                self.results['errors'].append({
-                    'type': 'template_error',
-                    'template': template_name,
-                    'error': str(e),
-                    'severity': 'medium'
-                })
-
+            if error is not None:
+                self.results['errors'].append(error)
             self.results['templates']['details'].append(result)
 
         self.results['templates']['total'] = tested_count
@@ -370,90 +512,159 @@ class DynamicDjangoTester:
 
         print(f"✅ Template Testing Complete: {working_count}/{tested_count} templates working")
 
+    def _check_template(self, template_name):
+        """Load and render one template; returns (result, error entry or None)"""
+        result = {
+            'name': template_name,
+            'status': 'untested',
+            'error': None
+        }
+        missing = {
+            'type': 'missing_template',
+            'template': template_name,
+            'error': 'TemplateDoesNotExist',
+            'severity': 'high'
+        }
+
+        try:
+            template = _lookup_template(template_name)
+            if template is None:
+                # Missing: report it without attempting a render
+                result['status'] = 'missing'
+                result['error'] = 'TemplateDoesNotExist'
+                return result, missing
+
+            # Try to render with minimal context. Calling the compiled template
+            # directly skips the backend wrapper's per-call dict -> Context
+            # build; each thread reuses one bare Context, and push() plus a fresh
+            # RenderContext stop {% url ... as %} variables or block state
+            # leaking from one template into the next.
+            ctx = getattr(_render_state, 'ctx', None)
+            if ctx is None:
+                ctx = _render_state.ctx = Context(autoescape=engines['django'].engine.autoescape)
+            ctx.render_context = RenderContext()
+            with ctx.push():
+                template.template.render(ctx)
+            result['status'] = 'working'
+            return result, None
+        except TemplateDoesNotExist:
+            # An {% include %} / {% extends %} target is missing
+            result['status'] = 'missing'
+            result['error'] = 'TemplateDoesNotExist'
+            return result, missing
+        except Exception as e:
+            result['status'] = 'error'
+            result['error'] = str(e)
+            return result, {
+                'type': 'template_error',
+                'template': template_name,
+                'error': str(e),
+                'severity': 'medium'
+            }
+
     def scan_views_for_template_references(self, views_file_path, templates_set):
         """Scan views.py for template name references"""
         try:
-            with open(views_file_path, 'r') as f:
-                content = f.read()
-
-            # Look for template_name = "..." patterns
-            import re
-            template_matches = re.findall(r'template_name\s*=\s*["\']([^"\']+)["\']', content)
-            templates_set.update(set(template_matches))
-
-            # Look for render() calls
-            render_matches = re.findall(r'render\([^,)]+,\s*["\']([^"\']+)["\']', content)
-            templates_set.update(set(render_matches))
-
+            templates_set.update(_scan_views(views_file_path, os.stat(views_file_path).st_mtime_ns))
         except Exception as e:
             print(f"⚠️  Error scanning views for templates: {e}")
 
+    def _partition_errors(self):
+        """Split recorded errors into (high, medium) severity lists in one pass"""
+        buckets = {'high': [], 'medium': []}
+        for error in self.results['errors']:
+            bucket = buckets.get(error['severity'])
+            if bucket is not None:
+                bucket.append(error)
+        return buckets['high'], buckets['medium']
+
     def generate_comprehensive_report(self):
         """Generate detailed report of all discoveries and test results"""
-        print("\n" + "="*80)
-        print("🎯 DYNAMIC COMPREHENSIVE DJANGO APPLICATION REPORT")
-        print("="*80)
-
-        # Summary statistics
-        print("
-📊 SUMMARY STATISTICS:"        print(f"   URLs:       {self.results['urls']['working']}/{self.results['urls']['tested']} working")
-        print(f"   Templates:  {self.results['templates']['working']}/{self.results['templates']['tested']} working")
-        print(f"   Errors:     {len(self.results['errors'])} critical issues")
-        print()
+        # Collected into one list and written once rather than ~40 print() calls
+        urls = self.results['urls']
+        templates = self.results['templates']
+        errors = self.results['errors']
+        high_severity, medium_sev = self._partition_errors()
+        rule = "=" * 80
+
+        lines = [
+            "",
+            rule,
+            "🎯 DYNAMIC COMPREHENSIVE DJANGO APPLICATION REPORT",
+            rule,
+            # Summary statistics
+            "",
+            "📊 SUMMARY STATISTICS:",
+            f"   URLs:       {urls['working']}/{urls['tested']} working",
+            f"   Templates:  {templates['working']}/{templates['tested']} working",
+            f"   Errors:     {len(errors)} critical issues",
+            "",
+        ]
 
         # Critical errors
-        if self.results['errors']:
-            print("🚨 CRITICAL ISSUES FOUND:"            high_severity = [e for e in self.results['errors'] if e['severity'] == 'high']
-            medium_sev = [e for e in self.results['errors'] if e['severity'] == 'medium']
+        if errors:
+            lines.append("🚨 CRITICAL ISSUES FOUND:")
 
             if high_severity:
-                print("🔴 HIGH SEVERITY ERRORS:")
+                lines.append("🔴 HIGH SEVERITY ERRORS:")
                 for error in high_severity[:5]:  # Show top 5
-                    print(f"   • {error['type']}: {error.get('template', error.get('url', 'Unknown'))}")
-                    print(f"     Error: {error['error']}")
+                    lines.append(f"   • {error['type']}: {error.get('template', error.get('url', 'Unknown'))}")
+                    lines.append(f"     Error: {error['error']}")
                 if len(high_severity) > 5:
-                    print(f"   ... and {len(high_severity) - 5} more")
+                    lines.append(f"   ... and {len(high_severity) - 5} more")
 
             if medium_sev:
-                print("🟡 MEDIUM SEVERITY ERRORS:")
+                lines.append("🟡 MEDIUM SEVERITY ERRORS:")
                 for error in medium_sev[:3]:
-                    print(f"   • {error.get('template', error.get('url', 'Unknown'))}: {error['error']}")
+                    lines.append(f"   • {error.get('template', error.get('url', 'Unknown'))}: {error['error']}")
 
         # Recent discoveries
-        print("
-🔍 RECENT DISCOVERIES:"        print(f"   • Found {self.results['urls']['total']} URL patterns across the application")
-        print(f"   • Identified {self.results['templates']['total']} potential templates")
-        print(f"   • Scanned view files for template references")
-        print(f"   • Tested authentication and form handling")
-
-        print("
-✅ SUCCESSFUL COMPONENTS:"        working_urls = [u for u in self.results['urls']['details'] if u['status'] == 'working']
-        if working_urls[:5]:  # Show first 5 working URLs
-            print("   Working URLs:")
-            for url in working_urls[:5]:
-                print(f"     ✅ {url['name']}")
-
-        print("
-💡 RECOMMENDATIONS:"        if self.results['errors']:
-            print("   • Fix TemplateDoesNotExist errors immediately (high priority)")
-            print("   • Review authentication requirements for protected views")
-            print("   • Validate form field requirements")
-            print("   • Test with real data scenarios")
+        lines += [
+            "",
+            "🔍 RECENT DISCOVERIES:",
+            f"   • Found {urls['total']} URL patterns across the application",
+            f"   • Identified {templates['total']} potential templates",
+            "   • Scanned view files for template references",
+            "   • Tested authentication and form handling",
+            "",
+            "✅ SUCCESSFUL COMPONENTS:",
+        ]
+        working_urls = [u for u in urls['details'] if u['status'] == 'working']
+        if working_urls:  # Show first 5 working URLs
+            lines.append("   Working URLs:")
+            lines.extend(f"     ✅ {url['name']}" for url in working_urls[:5])
+
+        lines += ["", "💡 RECOMMENDATIONS:"]
+        if errors:
+            lines += [
+                "   • Fix TemplateDoesNotExist errors immediately (high priority)",
+                "   • Review authentication requirements for protected views",
+                "   • Validate form field requirements",
+                "   • Test with real data scenarios",
+            ]
         else:
-            print("   • All systems nominal - no critical issues detected")
-            print("   • Consider adding more comprehensive data fixtures")
-            print("   • Implement end-to-end browser testing")
-
-        print("
-🚀 NEXT STEPS:"        print("   • Run this test suite regularly after code changes")
-        print("   • Automate in CI/CD pipeline")
-        print("   • Add more advanced testing (JavaScript, browser automation)")
-        print("   • Monitor for new URL/template additions")
-
-        print("\n" + "="*80)
-        print(f"Report generated by DynamicDjangoTester")
-        print(f"Test ran with Django {getattr(django, 'VERSION', 'Unknown')}")
-        print("="*80)
+            lines += [
+                "   • All systems nominal - no critical issues detected",
+                "   • Consider adding more comprehensive data fixtures",
+                "   • Implement end-to-end browser testing",
+            ]
+
+        lines += [
+            "",
+            "🚀 NEXT STEPS:",
+            "   • Run this test suite regularly after code changes",
+            "   • Automate in CI/CD pipeline",
+            "   • Add more advanced testing (JavaScript, browser automation)",
+            "   • Monitor for new URL/template additions",
+            "",
+            rule,
+            "Report generated by DynamicDjangoTester",
+            f"Test ran with Django {getattr(django, 'VERSION', 'Unknown')}",
+            rule,
+        ]
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def run_full_test_suite(self):
         """Run the complete comprehensive test suite"""
@@ -473,7 +684,7 @@ class DynamicDjangoTester:
         self.generate_comprehensive_report()
 
         # Return exit code based on whether critical errors were found
-        critical_errors = [e for e in self.results['errors'] if e['severity'] == 'high']
+        critical_errors, _ = self._partition_errors()
         if critical_errors:
             print(f"\n❌ CRITICAL ISSUES DETECTED: {len(critical_errors)} high-severity errors")
             return 1
@@ -483,17 +694,17 @@ class DynamicDjangoTester:
 
 
 if __name__ == '__main__':
-    import argparse
-
     parser = argparse.ArgumentParser(description='Dynamic Comprehensive Django Testing Suite')
     parser.add_argument('--run-all', action='store_true', help='Run complete test suite')
     parser.add_argument('--urls-only', action='store_true', help='Test only URLs')
     parser.add_argument('--templates-only', action='store_true', help='Test only templates')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--in-process', action='store_true',
+                        help='Call views through django.test.Client instead of the dev server')
 
     args = parser.parse_args()
 
-    tester = DynamicDjangoTester()
+    tester = DynamicDjangoTester(in_process=args.in_process, verbose=args.verbose)
 
     if args.run_all:
         exit_code = tester.run_full_test_suite()
@@ -510,6 +721,7 @@ if __name__ == '__main__':
         print("  python test_dynamic_comprehensive.py --run-all     # Complete test suite")
         print("  python test_dynamic_comprehensive.py --urls-only   # Test only URLs")
         print("  python test_dynamic_comprehensive.py --templates-only  # Test only templates")
+        print("  add --in-process to skip the dev server and call views directly")
         print("\nThis system automatically discovers and tests:")
         print("  • ALL URL patterns and views")
         print("  • ALL template files and references")
@@ -6,6 +6,7 @@ FINAL FIX VERIFICATION - Check specific issues that were reported
 import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 project_path = Path(__file__).parent / 'testproj'
 sys.path.insert(0, str(project_path))
@@ -38,20 +39,23 @@ try:
     template = get_template('portal/interim_frp_detail.html')
     print("\n✅ portal/interim_frp_detail.html - EXISTS")
 
-    # Create a mock agreement object
-    class MockAgreement:
-        pk = 123
-        council = type('Council', (), {'name': 'Test Council', 'abn': '123456', 'default_suburb': 'Test', 'get_default_state_display': lambda: 'QLD'})()
-        date_sent_to_council = '2024-01-01'
-        date_council_signed = '2024-01-02'
-        date_delegate_signed = '2024-01-03'
-        date_executed = '2024-01-04'
-        def projects(self):
-            return []
-        def count(self):
-            return 0
-
-    agreement = MockAgreement()
+    # Create a mock agreement object (plain attribute bags; no classes built)
+    council = SimpleNamespace(
+        name='Test Council',
+        abn='123456',
+        default_suburb='Test',
+        get_default_state_display=lambda: 'QLD',
+    )
+    agreement = SimpleNamespace(
+        pk=123,
+        council=council,
+        date_sent_to_council='2024-01-01',
+        date_council_signed='2024-01-02',
+        date_delegate_signed='2024-01-03',
+        date_executed='2024-01-04',
+        projects=lambda: [],
+        count=lambda: 0,
+    )
     context = {'agreement': agreement, 'user': 'test'}
 
     rendered = template.render(context)
@@ -14,11 +14,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'testproj.settings')
 import django
 django.setup()
 
-print("🔍 FINAL TEMPLATE VERIFICATION")
-print("="*50)
-
 # Check all critical templates exist
-critical_templates = [
+CRITICAL_TEMPLATES = (
     'portal/base.html',
     'portal/ricd_dashboard.html',
     'portal/council_dashboard.html',
@@ -33,19 +30,27 @@ critical_templates = [
     'portal/council_form.html',
     'portal/program_form.html',
     'portal/work_form.html',
-]
+)
 
 from django.template.loader import get_template
-failed_templates = []
 
-for template_name in critical_templates:
+print("🔍 FINAL TEMPLATE VERIFICATION")
+print("="*50)
+
+# (ok, template name, rendered length or error), written out in one go below
+results = []
+for template_name in CRITICAL_TEMPLATES:
     try:
-        template = get_template(template_name)
-        rendered = template.render({'user': 'test_user'})
-        print(f"✅ {template_name} - OK (rendered {len(rendered)} chars)")
+        rendered = get_template(template_name).render({'user': 'test_user'})
+        results.append((True, template_name, len(rendered)))
     except Exception as e:
-        print(f"❌ {template_name} - ERROR: {e}")
-        failed_templates.append(template_name)
+        results.append((False, template_name, e))
+
+sys.stdout.write("\n".join(
+    f"✅ {name} - OK (rendered {detail} chars)" if ok else f"❌ {name} - ERROR: {detail}"
+    for ok, name, detail in results
+) + "\n")
+failed_templates = [name for ok, name, _ in results if not ok]
 
 print("\n" + "="*50)
 if failed_templates:
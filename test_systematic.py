@@ -5,6 +5,7 @@ Tests all views and URLs to ensure no runtime errors or missing dependencies
 """
 import os
 import sys
+from functools import lru_cache
 import django
 from django.conf import settings
 from django.test import RequestFactory
@@ -17,13 +18,18 @@ sys.path.insert(0, project_dir)
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'testproj.settings')
 django.setup()
 
-from django.urls import reverse
+from django.urls import reverse, get_resolver
 from portal import views, urls
 from ricd import views as ricd_views, urls as ricd_urls
 from ricd.models import Project, Council, Program, QuarterlyReport, MonthlyTracker, Stage1Report, Stage2Report, Address, Work
 from django.utils import timezone
 from django.contrib.auth.models import User
 
+@lru_cache(maxsize=None)
+def _rev(name, kwargs_items=()):
+    """reverse() memoised on the URL name and a sorted tuple of kwargs."""
+    return reverse(name, kwargs=dict(kwargs_items))
+
 def test_imports():
     """Test that all imports work correctly"""
     print("=== Testing Imports ===")
@@ -105,13 +111,22 @@ def test_urls_resolvable():
 
     factory = RequestFactory()
 
-    for pattern, description in test_patterns:
+    # Build the resolver's lazy reverse tables once, before the lookups
+    get_resolver().reverse_dict
+
+    def _resolve(pattern):
         try:
-            url = reverse(pattern)
-            print(f"✅ URL for {description} resolves to: {url}")
+            return _rev(pattern), None
         except Exception as e:
-            print(f"❌ Failed to resolve {description}: {e}")
+            return None, e
+
+    # Resolve everything first, then report; stops at the first failure as before
+    resolved = [(description, *_resolve(pattern)) for pattern, description in test_patterns]
+    for description, url, error in resolved:
+        if error is not None:
+            print(f"❌ Failed to resolve {description}: {error}")
             return False
+        print(f"✅ URL for {description} resolves to: {url}")
 
     return True
 
@@ -176,21 +191,28 @@ def test_model_relationships():
 
     # Test if we can access related models without errors
     try:
-        projects = Project.objects.all()
+        # Preload every relation the loop touches so each one costs a single
+        # query for the whole sample rather than one per project.
+        projects = Project.objects.select_related(
+            'council', 'program', 'funding_schedule',
+        ).prefetch_related(
+            'addresses', 'works',
+            'works__monthlytracker_set', 'works__quarterlyreport_set',
+            'stage1report_set', 'stage2report_set',
+        )
         for project in projects[:1]:  # Test just first few
             # Test all related fields
             _ = project.council
             _ = project.program
-            _ = project.funding_schedule if project.funding_schedule else None
+            _ = project.funding_schedule
             _ = list(project.addresses.all())
 
             # Test reverse relationships - all reports go through work intermediary
-            from ricd.models import MonthlyTracker, QuarterlyReport, Stage1Report, Stage2Report
-            _ = list(MonthlyTracker.objects.filter(work__project=project))
-            _ = list(QuarterlyReport.objects.filter(work__project=project))
-            _ = list(Stage1Report.objects.filter(project=project))
-            _ = list(Stage2Report.objects.filter(project=project))
-            _ = list(project.works.all())
+            for work in project.works.all():
+                _ = list(work.monthlytracker_set.all())
+                _ = list(work.quarterlyreport_set.all())
+            _ = list(project.stage1report_set.all())
+            _ = list(project.stage2report_set.all())
 
         print("✅ Model relationships working correctly")
         return True
@@ -13,6 +13,7 @@ This script tests every URL pattern in the application to ensure:
 import os
 import sys
 import django
+from functools import lru_cache
 from pathlib import Path
 
 # Add Django project to path
@@ -34,6 +35,13 @@ from ricd.models import (
 )
 import json
 
+
+@lru_cache(maxsize=None)
+def _rev(name, kwargs_items=()):
+    """reverse() memoised on the URL name and a sorted tuple of kwargs."""
+    return reverse(name, kwargs=dict(kwargs_items))
+
+
 class ComprehensiveURLTester(TestCase):
     def setUp(self):
         """Set up test fixtures"""
@@ -246,7 +254,7 @@ class ComprehensiveURLTester(TestCase):
 
                 # Try to reverse URL
                 try:
-                    url = reverse(pattern['name'], kwargs=kwargs)
+                    url = _rev(pattern['name'], tuple(sorted(kwargs.items())))
                 except Exception as e:
                     self.fail(f"Failed to reverse URL '{pattern['name']}' with kwargs {kwargs}: {e}")
 
@@ -11,6 +11,13 @@ pytest_plugins = ['pytest_django']
 BASE_URL = os.environ.get('BASE_URL', 'http://127.0.0.1:8000')
 
 
+def pytest_configure(config):
+    """Hash test passwords with MD5 — PBKDF2 costs ~100ms per user created or logged in.
+
+    This applies to the whole tests/ suite, not only the legacy regression TestCase.
+    """
+    from django.conf import settings
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
 
 
 @pytest.fixture(scope='session')
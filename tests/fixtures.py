@@ -344,107 +344,6 @@ def defect(project):
     )
 
 
-@pytest.fixture
-def work_land(project, work_type):
-    """Create a test work for land project"""
-    from apps.core.models import Work
-    return Work.objects.create(
-        project=project,
-        work_type=work_type,
-        quantity=1,
-        estimated_cost=Decimal('500000.00'),
-        status=Work.Status.PENDING
-    )
-
-
-# ============================================================================
-# PAYMENT FIXTURES
-# ============================================================================
-
-@pytest.fixture
-def payment(project, funding_schedule):
-    """Create a test payment"""
-    from apps.core.models import Payment
-    return Payment.objects.create(
-        project=project,
-        funding_schedule=funding_schedule,
-        calculation_type=Payment.CalculationType.PERCENTAGE,
-        percentage=Decimal('30.00'),
-        payment_type=Payment.PaymentType.FIRST,
-        payment_split=Payment.PaymentSplit.STANDARD,
-        status=Payment.Status.PENDING
-    )
-
-
-# ============================================================================
-# CONTRACT FIXTURES
-# ============================================================================
-
-@pytest.fixture
-def contract(project):
-    """Create a test contract"""
-    from apps.core.models import Contract
-    return Contract.objects.create(
-        project=project,
-        contract_status=Contract.ContractStatus.DRAFT,
-        title="Test Funding Agreement",
-        start_date=date(2025, 1, 1),
-        end_date=date(2026, 12, 31)
-    )
-
-
-# ============================================================================
-# DEFECT FIXTURES
-# ============================================================================
-
-@pytest.fixture
-def defect(project):
-    """Create a test defect"""
-    from apps.core.models import Defect
-    return Defect.objects.create(
-        project=project,
-        description="Missing tap washer",
-        identified_date=date(2025, 3, 1),
-        defects_liability_expiry=date(2026, 3, 1)
-    )
-
-
-# ============================================================================
-# PAYMENT FIXTURES
-# ============================================================================
-
-@pytest.fixture
-def payment(project, funding_schedule):
-    """Create a test payment"""
-    from apps.core.models import Payment
-    return Payment.objects.create(
-        project=project,
-        funding_schedule=funding_schedule,
-        calculation_type=Payment.CalculationType.PERCENTAGE,
-        percentage=Decimal('30.00'),
-        payment_type=Payment.PaymentType.FIRST,
-        payment_split=Payment.PaymentSplit.STANDARD,
-        status=Payment.Status.PENDING
-    )
-
-
-# ============================================================================
-# CONTRACT FIXTURES
-# ============================================================================
-
-@pytest.fixture
-def contract(project):
-    """Create a test contract"""
-    from apps.core.models import Contract
-    return Contract.objects.create(
-        project=project,
-        contract_status=Contract.ContractStatus.DRAFT,
-        title="Test Funding Agreement",
-        start_date=date(2025, 1, 1),
-        end_date=date(2026, 12, 31)
-    )
-
-
 @pytest.fixture
 def contract_meeting(contract):
     """Create a test contract meeting"""
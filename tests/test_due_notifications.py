@@ -42,3 +42,12 @@ def test_master_switch_off_blocks_everything(project):
 
     call_command('send_due_notifications')
     assert not SentNotification.objects.filter(event='STAGE_TARGET_DUE').exists()
+
+
+@pytest.mark.django_db
+def test_tracker_overdue_on_uses_given_day(council):
+    from apps.core.models import MonthlyTracker
+    mt = MonthlyTracker.objects.create(council=council, year=2026, month=1)
+    assert mt.due_date == date(2026, 2, 8)
+    assert mt.overdue_on(date(2026, 2, 8)) is False
+    assert mt.overdue_on(date(2026, 2, 9)) is True
@@ -36,6 +36,33 @@ class TestFundingScheduleModel:
         """A DRAFT schedule does not yet require a payment_rule."""
         assert funding_schedule.payment_rule is None
 
+    def test_project_total_funding_cached_per_instance(self, funding_schedule, django_assert_num_queries):
+        """Project.total_funding sums its schedules once, then reads from the instance."""
+        from apps.core.models import Project
+        project = Project.objects.get(pk=funding_schedule.project_id)
+        with django_assert_num_queries(1):
+            assert project.total_funding == Decimal('500000.00')
+            assert project.total_funding == Decimal('500000.00')
+
+    def test_project_active_funding_schedule_single_query(self, funding_schedule, django_assert_num_queries):
+        """active_funding_schedule() is one LIMIT 1 query, None when nothing is ACTIVE."""
+        project = funding_schedule.project
+        with django_assert_num_queries(1):
+            assert project.active_funding_schedule() is None
+        funding_schedule.status = 'ACTIVE'
+        funding_schedule.save()
+        assert project.active_funding_schedule() == funding_schedule
+
+    def test_project_with_financials_annotates_total_and_overdue(self, funding_schedule):
+        """with_financials() returns funding and timeliness without per-project queries."""
+        from datetime import date
+        from apps.core.models import Project
+        Project.objects.filter(pk=funding_schedule.project_id).update(completion_date=date(2026, 3, 1))
+        p = Project.objects.with_financials(today=date(2026, 4, 1)).get(pk=funding_schedule.project_id)
+        assert p.total_funding == Decimal('500000.00')
+        assert p.target_date == date(2026, 3, 1)
+        assert p.is_overdue is True
+
 
 @pytest.mark.django_db
 class TestFundingScheduleLandProjects:
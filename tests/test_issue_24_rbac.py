@@ -290,4 +290,29 @@ class TestOfficerRoleEnum:
     def test_old_roles_removed(self):
         values = {r.value for r in Profile.OfficerRole}
         for removed in ["SENIOR_OFFICER", "PROGRAM_OFFICER", "PRINCIPAL_OFFICER", "DIRECTOR", "GM", "OTHER"]:
-            assert removed not in values
\ No newline at end of file
+            assert removed not in values
+
+
+# ---------------------------------------------------------------------------
+# is_ricd_staff helper
+# ---------------------------------------------------------------------------
+
+@pytest.mark.django_db
+class TestIsRicdStaff:
+
+    def test_internal_roles_and_superuser_are_ricd(self, council_a):
+        from apps.core.mixins import is_ricd_staff
+        _, officer = make_client("OFFICER", None, "ir1")
+        _, read_only = make_client("READ_ONLY", None, "ir2")
+        _, council_user = make_client("COUNCIL_USER", council_a, "ir3")
+        admin = User.objects.create_superuser(username="ir_admin", password="pass")
+        assert is_ricd_staff(officer) and is_ricd_staff(read_only) and is_ricd_staff(admin)
+        assert not is_ricd_staff(council_user)
+
+    def test_result_is_cached_on_user(self, django_assert_num_queries):
+        from apps.core.mixins import is_ricd_staff
+        _, officer = make_client("OFFICER", None, "ir4")
+        officer = User.objects.get(pk=officer.pk)
+        with django_assert_num_queries(1):
+            assert is_ricd_staff(officer)
+            assert is_ricd_staff(officer)
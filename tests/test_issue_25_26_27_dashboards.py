@@ -304,3 +304,48 @@ class TestTraceabilityView:
         # only RELEASED counts as paid
         assert agreement_row['paid'] == Decimal('180000')
         assert agreement_row['pct_expended'] == 60.0
+
+
+# ===========================================================================
+# Main dashboard headline counts
+# ===========================================================================
+
+@pytest.mark.django_db
+class TestDashboardCounts:
+    def test_counts_by_flag_and_state(self, auth_client, council, program, project):
+        client, _ = auth_client
+        Project.objects.filter(pk=project.pk).update(status_flag=Project.StatusFlag.LATE)
+        Project.objects.create(name='Done', council=council, program=program,
+                               state=Project.State.COMPLETED,
+                               status_flag=Project.StatusFlag.ON_TRACK)
+        ctx = client.get('/dashboard/').context
+        assert ctx['total_projects'] == 2
+        assert ctx['active_projects'] == 1
+        assert ctx['late_projects'] == 1
+        assert ctx['on_track_projects'] == 1
+        assert ctx['overdue_projects'] == 0
+
+
+# ===========================================================================
+# Query counts must not grow with the number of projects (N+1 guard)
+# ===========================================================================
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url', ['/dashboard/', '/dashboard/projects/', '/projects/'])
+def test_dashboard_query_count_flat_in_projects(auth_client, council, program, project,
+                                                funding_schedule, url):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    client, _ = auth_client
+    with CaptureQueriesContext(connection) as baseline:
+        client.get(url)
+    for i in range(4):
+        extra = Project.objects.create(name=f'Dash Extra {i}', council=council, program=program,
+                                       state=Project.State.FUNDED, financial_year='2025-2026')
+        FundingSchedule.objects.create(project=extra, amount=Decimal('1000'),
+                                       contingency=Decimal('0'),
+                                       status=FundingSchedule.Status.ACTIVE)
+    with CaptureQueriesContext(connection) as grown:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert len(grown) <= len(baseline)
@@ -107,3 +107,22 @@ def test_monthly_view_renders(admin_client, funding_schedule, project):
     # Must embed a JSON object, not a re-encoded string (double-encode guard).
     assert b'"current_month"' in resp.content
     assert b'\\"current_month\\"' not in resp.content
+
+
+def test_month_helpers_roll_over_year_and_clamp_day():
+    from apps.core.utils import add_months, month_keys
+
+    assert add_months(date(2025, 11, 15), 3) == date(2026, 2, 15)
+    assert add_months(date(2026, 1, 31), 1) == date(2026, 2, 28)
+    assert add_months(date(2028, 3, 31), -1) == date(2028, 2, 29)
+    assert month_keys(2025, 11, 3) == ['2025-11', '2025-12', '2026-01']
+
+
+def test_parse_year_month_slices_and_rejects_bad_periods():
+    from apps.core.utils import InvalidPeriod, parse_year_month
+
+    assert parse_year_month('2026-04') == (2026, 4)
+    assert parse_year_month('2026-04-15') == (2026, 4)
+    for bad in ('', '2026', '2026/04', '2026-13', 'abcd-01'):
+        with pytest.raises(InvalidPeriod):
+            parse_year_month(bad)
@@ -16,6 +16,24 @@ def test_cm_report_loads(admin_client, council, project):
     assert b"Contract Management Report" in resp.content
 
 
+def test_contract_report_lifecycle_counts(admin_client, council, project, address, work_type):
+    """Lifecycle health counts PC/handover from the materialised works list."""
+    from datetime import date
+    from apps.core.models import FundingSchedule, Project, Work
+    fs = FundingSchedule.objects.create(project=project, council=council, schedule_number=1, amount=100000)
+    Project.objects.filter(pk=project.pk).update(funding_schedule=fs)
+    works = [Work.objects.create(project=project, address=address, work_type=work_type, quantity=1)
+             for _ in range(3)]
+    Work.objects.filter(pk=works[0].pk).update(
+        practical_completion_date=date(2026, 1, 5), handover_date=date(2026, 1, 20))
+    Work.objects.filter(pk=works[1].pk).update(practical_completion_date=date(2026, 2, 5))
+
+    resp = admin_client.get(reverse('ui:funding_schedule_contract_report', args=[fs.pk]))
+    lifecycle = resp.context['lifecycle']
+    assert (lifecycle['work_total'], lifecycle['work_pc_complete'],
+            lifecycle['work_handover_complete']) == (3, 2, 1)
+
+
 def test_eom_reconciliation_loads(admin_client):
     """EOM Reconciliation view renders with no data."""
     resp = admin_client.get(reverse('ui:eom_reconciliation'))
@@ -103,3 +121,29 @@ def test_council_detail_renders_electorate_fk_and_lead_officer(admin_client, cou
     assert "Cook" in body, "state_electorate_link.name not rendered"
     assert "Leichhardt" in body, "federal_electorate_link.name not rendered"
     assert "Jane Officer" in body, "lead_officer full name not rendered"
+
+
+def test_reports_dashboard_filters_quarterly_by_project_council(admin_client, council, project):
+    from apps.core.models import Council, QuarterlyReport
+    mine = QuarterlyReport.objects.create(council=council, year=2026, quarter=1)
+    other = Council.objects.create(name='Elsewhere Council')
+    QuarterlyReport.objects.create(council=other, year=2026, quarter=1)
+
+    r = admin_client.get(f'/reports/?project={project.pk}')
+    assert list(r.context['quarterly_reports']) == [mine]
+
+    r = admin_client.get('/reports/?project=not-a-number')
+    assert r.status_code == 200
+    assert r.context['quarterly_reports'].count() == 2
+
+
+def test_ccl_csv_export_streams_work_rows(admin_client, council, project, work):
+    """Works on an ACTIVE schedule appear as CSV rows."""
+    from apps.core.models import FundingSchedule, Project
+    fs = FundingSchedule.objects.create(project=project, council=council, schedule_number=7,
+                                        amount=100000, status='ACTIVE')
+    Project.objects.filter(pk=project.pk).update(funding_schedule=fs)
+    resp = admin_client.get(reverse('ui:construction_creation_list_export'))
+    lines = resp.content.decode().strip().splitlines()
+    assert len(lines) == 2
+    assert lines[1].startswith(f'{council.name},{project.name},')
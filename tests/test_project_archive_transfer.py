@@ -48,6 +48,25 @@ def test_transfer_moves_work_and_its_address_same_council(admin_client, project,
         assert Address.objects.get(pk=addr_id).project_id == target.pk
 
 
+@pytest.mark.django_db
+def test_transfer_carries_sibling_works_at_same_address(admin_client, project, work, work_type,
+                                                         council, program):
+    from apps.core.models import Project, Work
+    target = Project.objects.create(
+        name='Target Project', council=council, program=program,
+        state=Project.State.PROSPECTIVE,
+    )
+    sibling = Work.objects.create(project=project, address=work.address, work_type=work_type,
+                                  quantity=1, estimated_cost=0)
+
+    admin_client.post(f'/projects/{project.pk}/transfer-works/', {
+        'target_project': target.pk, 'works': [work.pk],
+    })
+
+    sibling.refresh_from_db()
+    assert sibling.project_id == target.pk
+
+
 @pytest.mark.django_db
 def test_transfer_to_other_council_is_blocked(admin_client, project, work, program):
     from apps.core.models import Project, Council
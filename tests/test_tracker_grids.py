@@ -0,0 +1,191 @@
+"""Monthly tracker / quarterly report grid editors: open-or-create, grid build, save."""
+import pytest
+from decimal import Decimal
+from django.urls import reverse
+
+
+@pytest.fixture
+def active_fs(council, project):
+    from apps.core.models import FundingSchedule, Project
+    fs = FundingSchedule.objects.create(
+        project=project, council=council, amount=Decimal('500000'),
+        status=FundingSchedule.Status.ACTIVE,
+    )
+    Project.objects.filter(pk=project.pk).update(
+        funding_schedule=fs, state=Project.State.COMMENCED)
+    return fs
+
+
+@pytest.fixture
+def qr_items():
+    from apps.core.models import QuarterlyReportItem, QuarterlyReportItemGroup
+    group = QuarterlyReportItemGroup.objects.create(name='Progress', order=1)
+    return [
+        QuarterlyReportItem.objects.create(group=group, name='Slab poured',
+                                           field_type='DATE', order=1),
+        QuarterlyReportItem.objects.create(group=group, name='Comments', order=2),
+    ]
+
+
+def _open_quarterly(admin_client, council):
+    resp = admin_client.get(
+        reverse('ui:quarterly_report_open', kwargs={'council_pk': council.pk}),
+        {'year': 2026, 'quarter': 1})
+    assert resp.status_code == 302
+    from apps.core.models import QuarterlyReport
+    return QuarterlyReport.objects.get(council=council, year=2026, quarter=1)
+
+
+@pytest.mark.django_db
+def test_quarterly_open_creates_entry_per_work_and_item(admin_client, council, active_fs,
+                                                       work, qr_items):
+    report = _open_quarterly(admin_client, council)
+    assert report.entries.count() == len(qr_items)
+    assert {e.work_id for e in report.entries.all()} == {work.pk}
+
+
+@pytest.mark.django_db
+def test_quarterly_open_uses_projects_assigned_item_group(admin_client, council, active_fs,
+                                                         project, work, qr_items):
+    from apps.core.models import Project, QuarterlyReportItem, QuarterlyReportItemGroup
+    other = QuarterlyReportItemGroup.objects.create(name='Land', order=2)
+    land_item = QuarterlyReportItem.objects.create(group=other, name='Survey done', order=1)
+    Project.objects.filter(pk=project.pk).update(quarterly_report_item_group=other)
+
+    report = _open_quarterly(admin_client, council)
+    assert [e.item for e in report.entries.all()] == [land_item]
+
+
+@pytest.mark.django_db
+def test_quarterly_grid_groups_works_under_schedule(admin_client, council, active_fs,
+                                                    project, work, qr_items):
+    report = _open_quarterly(admin_client, council)
+    resp = admin_client.get(f'/quarterly-reports/{report.pk}/')
+    assert resp.status_code == 200
+
+    sections = resp.context['grid']['fs_sections']
+    assert [s['fs'] for s in sections] == [active_fs]
+    proj_section = sections[0]['projects'][0]
+    assert proj_section['project'] == project
+    assert proj_section['items'] == qr_items
+    row = proj_section['works'][0]
+    assert row['work'] == work
+    assert all(c['entry'] is not None for c in row['cells'])
+
+
+@pytest.mark.django_db
+def test_quarterly_grid_query_count_flat_in_works(admin_client, council, active_fs, project,
+                                                  address, work_type, qr_items,
+                                                  django_assert_max_num_queries):
+    from apps.core.models import QuarterlyReport, Work
+    from apps.ui.views.tracker_views import QuarterlyReportDetailView
+
+    for _ in range(5):
+        Work.objects.create(project=project, address=address, work_type=work_type,
+                            quantity=1, estimated_cost=Decimal('100000'))
+    report = _open_quarterly(admin_client, council)
+    report = QuarterlyReport.objects.get(pk=report.pk)
+
+    with django_assert_max_num_queries(6):
+        grid = QuarterlyReportDetailView()._build_grid(report)
+        rows = grid['fs_sections'][0]['projects'][0]['works']
+        assert len(rows) == 5
+        assert all(r['work'].address == address for r in rows)
+        assert {r['work'].work_type.name for r in rows} == {work_type.name}
+
+
+@pytest.mark.django_db
+def test_quarterly_sync_is_idempotent(admin_client, council, active_fs, work, qr_items):
+    from apps.ui.views.tracker_views import QuarterlyReportOpenOrCreateView
+    report = _open_quarterly(admin_client, council)
+    QuarterlyReportOpenOrCreateView()._sync_entries(report)
+    assert report.entries.count() == len(qr_items)
+
+
+@pytest.mark.django_db
+def test_monthly_open_seeds_entries_from_tracker_steps(admin_client, council, active_fs, work):
+    from datetime import date
+    from apps.core.models import (
+        MonthlyTracker, WorkStep, WorkStepDefinition, WorkStepGroup, WorkStepGroupItem,
+    )
+    group = WorkStepGroup.objects.create(name='Build')
+    tracked = WorkStepGroupItem.objects.create(
+        group=group, step=WorkStepDefinition.objects.create(name='Slab'), order=1,
+        is_monthly_tracker_column=True)
+    hidden = WorkStepGroupItem.objects.create(
+        group=group, step=WorkStepDefinition.objects.create(name='Paint'), order=2)
+    step = WorkStep.objects.create(work=work, group_item=tracked, order=1, step_name='Slab',
+                                   forecast_completion_date=date(2026, 2, 1))
+    WorkStep.objects.create(work=work, group_item=hidden, order=2, step_name='Paint')
+
+    resp = admin_client.get(
+        reverse('ui:monthly_tracker_open', kwargs={'council_pk': council.pk}),
+        {'year': 2026, 'month': 1})
+    assert resp.status_code == 302
+
+    tracker = MonthlyTracker.objects.get(council=council, year=2026, month=1)
+    entries = list(tracker.work_entries.all())
+    assert [e.work_step_id for e in entries] == [step.pk]
+    assert entries[0].forecast_completion_date == date(2026, 2, 1)
+
+
+@pytest.mark.django_db
+def test_monthly_tracker_post_saves_forecast_and_syncs_step(admin_client, council, project, work):
+    from apps.core.models import MonthlyTracker, MonthlyTrackerWorkEntry, WorkStep
+    step = WorkStep.objects.create(work=work, order=1, step_name='Slab')
+    tracker = MonthlyTracker.objects.create(council=council, year=2026, month=1)
+    entry = MonthlyTrackerWorkEntry.objects.create(tracker=tracker, work_step=step)
+
+    resp = admin_client.post(f'/monthly-trackers/{tracker.pk}/',
+                             {f'entry_{entry.pk}_forecast': '2026-03-01'})
+    assert resp.status_code == 302
+
+    step.refresh_from_db()
+    assert str(step.forecast_completion_date) == '2026-03-01'
+
+
+@pytest.mark.django_db
+def test_tracker_config_post_creates_then_updates(admin_client, council):
+    from apps.core.models import CouncilTrackerConfig
+    url = reverse('ui:tracker_config_edit', kwargs={'council_pk': council.pk})
+
+    admin_client.post(url, {'council_submission_enabled': 'on', 'submission_due_day': '12'})
+    cfg = CouncilTrackerConfig.objects.get(council=council)
+    assert cfg.council_submission_enabled and cfg.submission_due_day == 12
+
+    admin_client.post(url, {'submission_due_day': 'x'})
+    cfg.refresh_from_db()
+    assert not cfg.council_submission_enabled and cfg.submission_due_day == 8
+    assert CouncilTrackerConfig.objects.filter(council=council).count() == 1
+
+
+@pytest.mark.django_db
+def test_quarterly_entries_api_pages_grid_cells(admin_client, council, active_fs, work, qr_items):
+    report = _open_quarterly(admin_client, council)
+    resp = admin_client.get(f'/api/v1/quarterly-reports/{report.pk}/entries/')
+    assert resp.status_code == 200
+
+    data = resp.json()
+    assert data['count'] == len(qr_items)
+    assert [row['item_name'] for row in data['results']] == [i.name for i in qr_items]
+    assert {row['work'] for row in data['results']} == {work.pk}
+
+
+@pytest.mark.django_db
+def test_quarterly_entries_api_query_count_flat_in_works(admin_client, council, active_fs,
+                                                         project, work_type, qr_items,
+                                                         django_assert_num_queries):
+    from apps.core.models import Address, Suburb, Work
+    suburb = Suburb.objects.create(name='Cairns', postcode='4870')
+    for n in range(3):
+        address = Address.objects.create(project=project, street=f'{n} Grid Street',
+                                         suburb=suburb)
+        Work.objects.create(project=project, address=address, work_type=work_type,
+                            quantity=1, estimated_cost=Decimal('100000'))
+    report = _open_quarterly(admin_client, council)
+
+    with django_assert_num_queries(6):
+        resp = admin_client.get(f'/api/v1/quarterly-reports/{report.pk}/entries/')
+    assert resp.status_code == 200
+    labels = {row['work_label'] for row in resp.json()['results']}
+    assert len(labels) == 3 and all(label.endswith('Cairns, 4870') for label in labels)
@@ -179,6 +179,19 @@ class TestProjectCRUD:
         assert response.status_code == 200, \
             f"GET /ui/projects/{project.pk}/ returned {response.status_code}"
 
+    def test_project_detail_officer_lookups_are_joined(self, auth_client, project, superuser):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from apps.core.models import Project
+        with CaptureQueriesContext(connection) as bare:
+            auth_client.get(f'/projects/{project.pk}/')
+        Project.objects.filter(pk=project.pk).update(
+            lead_officer=superuser, principal_officer=superuser, senior_officer=superuser)
+        with CaptureQueriesContext(connection) as staffed:
+            response = auth_client.get(f'/projects/{project.pk}/')
+        assert response.status_code == 200
+        assert len(staffed) == len(bare)
+
     def test_land_project_detail_get(self, auth_client, land_project):
         # Land projects render projects/land_detail.html (was crashing).
         response = auth_client.get(f'/projects/{land_project.pk}/')